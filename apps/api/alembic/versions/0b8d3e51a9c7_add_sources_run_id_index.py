@@ -0,0 +1,32 @@
+"""add sources run_id index
+
+Revision ID: 0b8d3e51a9c7
+Revises: e6a09b17d3f5
+Create Date: 2026-10-15 15:03:41.882617
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b8d3e51a9c7'
+down_revision: Union[str, Sequence[str], None] = 'e6a09b17d3f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_sources_run_id',
+        'sources',
+        ['run_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_sources_run_id', table_name='sources')
@@ -0,0 +1,54 @@
+"""make research_steps run_id/step_type index unique
+
+Revision ID: 1c9e4a7b2d58
+Revises: 0b8d3e51a9c7
+Create Date: 2026-10-15 16:21:07.514382
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1c9e4a7b2d58'
+down_revision: Union[str, Sequence[str], None] = '0b8d3e51a9c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Same columns, now unique: still serves the stage-gate lookups, and is
+    # the conflict target for step inserts (one step per type per run).
+    #
+    # The old check-then-insert gates could race and record the same stage
+    # twice for a run. Keep the earliest (lowest step_index) step of each
+    # type so the unique index can be built; nothing references step rows.
+    op.execute(
+        """
+        DELETE FROM research_steps AS s
+        USING research_steps AS keep
+        WHERE s.run_id = keep.run_id
+          AND s.step_type = keep.step_type
+          AND (s.step_index, s.id) > (keep.step_index, keep.id)
+        """
+    )
+    op.drop_index('ix_research_steps_run_type', table_name='research_steps')
+    op.create_index(
+        'uq_research_steps_run_type',
+        'research_steps',
+        ['run_id', 'step_type'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_research_steps_run_type', table_name='research_steps')
+    op.create_index(
+        'ix_research_steps_run_type',
+        'research_steps',
+        ['run_id', 'step_type'],
+        unique=False,
+    )
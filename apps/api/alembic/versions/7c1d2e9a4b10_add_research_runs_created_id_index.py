@@ -0,0 +1,32 @@
+"""add research_runs created_at/id index
+
+Revision ID: 7c1d2e9a4b10
+Revises: 55eed2ff6535
+Create Date: 2026-10-15 09:12:04.118342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1d2e9a4b10'
+down_revision: Union[str, Sequence[str], None] = '55eed2ff6535'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_research_runs_created_id',
+        'research_runs',
+        ['created_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_research_runs_created_id', table_name='research_runs')
@@ -0,0 +1,40 @@
+"""add pipeline events run_id/created_at index
+
+Revision ID: c41e7b93f0d2
+Revises: a3f8c5d21e47
+Create Date: 2026-10-15 11:20:51.904417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e7b93f0d2'
+down_revision: Union[str, Sequence[str], None] = 'a3f8c5d21e47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY can't run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_pipeline_events_run_created',
+            'pipeline_events',
+            ['run_id', 'created_at'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_pipeline_events_run_created',
+            table_name='pipeline_events',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,32 @@
+"""add research_steps run_id/step_index index
+
+Revision ID: d52f8a04c1e3
+Revises: c41e7b93f0d2
+Create Date: 2026-10-15 11:48:12.630275
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd52f8a04c1e3'
+down_revision: Union[str, Sequence[str], None] = 'c41e7b93f0d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_research_steps_run_idx',
+        'research_steps',
+        ['run_id', 'step_index'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_research_steps_run_idx', table_name='research_steps')
@@ -0,0 +1,32 @@
+"""add research_steps run_id/step_type index
+
+Revision ID: e6a09b17d3f5
+Revises: d52f8a04c1e3
+Create Date: 2026-10-15 12:05:44.271190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a09b17d3f5'
+down_revision: Union[str, Sequence[str], None] = 'd52f8a04c1e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_research_steps_run_type',
+        'research_steps',
+        ['run_id', 'step_type'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_research_steps_run_type', table_name='research_steps')
@@ -1,7 +1,15 @@
+import asyncio
+import base64
+import binascii
+from collections.abc import AsyncIterator
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
-from sqlalchemy import select, desc
+import orjson
+from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status, BackgroundTasks
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, lambda_stmt, select, tuple_
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,6 +19,7 @@ from app.schemas.research_runs import (
     ResearchRunCreate,
     ResearchRunRead,
     ResearchRunDetail,
+    ResearchRunPage,
 )
 from app.services.research_service import (
     create_research_run_with_basic_plan,
@@ -21,6 +30,8 @@ from app.services.pipeline_orchestrator import (
     RunNotFoundError,
     InvalidPipelineStateError,
 )
+from app.services.run_cache import RUN_CACHE_CONTROL, CacheKey, run_response_cache
+from app.services.event_stream import pipeline_event_broker
 from app.schemas.research_state import ResearchRunState
 from app.schemas.execution import ExecutionMode
 from app.core.config import get_settings
@@ -31,6 +42,25 @@ router = APIRouter(
     tags=["research-runs"],
 )
 
+# Detail loads currently in flight, so concurrent polls of the same run share
+# a single query instead of each running the full selectinload fan-out.
+# Keyed by cache key (run + version), so a request made after a write never
+# joins, and then caches, a load that started before it.
+_inflight_details: dict[CacheKey, asyncio.Task[tuple[bytes, ResearchRunStatus]]] = {}
+
+_LIST_QUERY_PREVIEW_CHARS = 280
+
+_TERMINAL_RUN_STATUSES = frozenset({ResearchRunStatus.COMPLETED, ResearchRunStatus.FAILED})
+_TERMINAL_MESSAGE_TYPES = frozenset(status.value for status in _TERMINAL_RUN_STATUSES)
+
+
+def get_orchestrator(db: AsyncSession = Depends(get_db)) -> PipelineOrchestrator:
+    """
+    FastAPI dependency: one orchestrator per request, bound to its session.
+    """
+    return PipelineOrchestrator(db=db)
+
+
 async def _execute_pipeline_in_background(run_id: UUID, mode: ExecutionMode) -> None:
     async with AsyncSessionLocal() as db:
         orchestrator = PipelineOrchestrator(db=db)
@@ -42,6 +72,105 @@ async def _execute_pipeline_in_background(run_id: UUID, mode: ExecutionMode) ->
             return
 
 
+def _orjson_default(obj: object) -> str:
+    # asyncpg returns its own UUID type, which orjson doesn't recognise.
+    if isinstance(obj, UUID):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _model_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Serialize with pydantic-core directly, bypassing FastAPI's response_model
+    re-validation and jsonable_encoder pass.
+    """
+    return Response(
+        content=model.model_dump_json(),
+        media_type="application/json",
+        status_code=status_code,
+    )
+
+
+def _run_response(body: bytes, etag: str) -> Response:
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": RUN_CACHE_CONTROL},
+    )
+
+
+def _cached_run_response(request: Request, key: CacheKey, etag: str) -> Response | None:
+    """
+    Serve a run payload straight from the response cache, skipping the DB
+    and Pydantic entirely. Answers 304 when the client already holds it.
+    """
+    cached = run_response_cache.get(key)
+    if cached is None:
+        return None
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": RUN_CACHE_CONTROL},
+        )
+
+    return _run_response(cached.body, etag)
+
+
+async def _build_detail_body(run_id: UUID) -> tuple[bytes, ResearchRunStatus]:
+    # Own session: the load must outlive any single (possibly cancelled) caller.
+    async with AsyncSessionLocal() as db:
+        orchestrator = PipelineOrchestrator(db=db)
+        run = await orchestrator.get_run_detail(run_id)
+        body = ResearchRunDetail.model_validate(run).model_dump_json().encode("utf-8")
+        return body, run.status
+
+
+def _forget_inflight_detail(key: CacheKey, task: asyncio.Task) -> None:
+    _inflight_details.pop(key, None)
+    if not task.cancelled():
+        # Mark the exception retrieved even if every waiter went away.
+        task.exception()
+
+
+async def _load_detail_body(
+    run_id: UUID,
+    key: CacheKey,
+) -> tuple[bytes, ResearchRunStatus]:
+    """
+    Singleflight wrapper around _build_detail_body.
+
+    The first caller starts the load; everyone else awaits the same task.
+    Awaiting through asyncio.shield keeps a cancelled caller from cancelling
+    the shared load for the remaining waiters.
+    """
+    task = _inflight_details.get(key)
+    if task is None:
+        task = asyncio.create_task(_build_detail_body(run_id))
+        _inflight_details[key] = task
+        task.add_done_callback(lambda t: _forget_inflight_detail(key, t))
+
+    return await asyncio.shield(task)
+
+
+def _encode_cursor(created_at: datetime, run_id: UUID) -> str:
+    raw = f"{created_at.isoformat()}|{run_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at_raw, run_id_raw = raw.split("|", 1)
+        return datetime.fromisoformat(created_at_raw), UUID(run_id_raw)
+    except (binascii.Error, UnicodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
 @router.post(
     "",
     response_model=ResearchRunRead,
@@ -50,12 +179,15 @@ async def _execute_pipeline_in_background(run_id: UUID, mode: ExecutionMode) ->
 async def create_research_run(
     payload: ResearchRunCreate,
     db: AsyncSession = Depends(get_db),
-) -> ResearchRunRead:
+) -> Response:
     run = await create_research_run_with_basic_plan(
         payload=payload.model_dump(),
         db=db,
     )
-    return run
+    return _model_response(
+        ResearchRunRead.model_validate(run),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.get(
@@ -65,12 +197,24 @@ async def create_research_run(
 )
 async def get_research_run(
     run_id: UUID,
+    request: Request,
     db: AsyncSession = Depends(get_db),
-) -> ResearchRunRead:
+) -> Response:
+    # Resolve key/etag before reading so a concurrent write can't be cached
+    # under the newer version.
+    key = run_response_cache.key(run_id, "read")
+    etag = run_response_cache.etag(run_id)
+
+    cached = _cached_run_response(request, key, etag)
+    if cached is not None:
+        return cached
+
+    # lambda_stmt caches the compiled SQL; run_id is tracked as a bound param.
     result = await db.execute(
-        select(ResearchRun).where(ResearchRun.id == run_id)
+        lambda_stmt(lambda: select(ResearchRun).where(ResearchRun.id == run_id))
     )
-    run = result.scalar_one_or_none()
+    # PK lookup: at most one row, so skip scalar_one_or_none's uniqueness check
+    run = result.scalars().first()
 
     if run is None:
         raise HTTPException(
@@ -78,30 +222,62 @@ async def get_research_run(
             detail="Research run not found",
         )
 
-    return run
+    body = ResearchRunRead.model_validate(run).model_dump_json().encode("utf-8")
+    run_response_cache.set(key, body, run.status)
+
+    return _run_response(body, etag)
 
 
 @router.get(
     "",
-    response_model=list[ResearchRunRead],
+    response_model=ResearchRunPage,
     status_code=status.HTTP_200_OK,
 )
 async def list_research_runs(
-    limit: int = 20,
-    offset: int = 0,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
     db: AsyncSession = Depends(get_db),
-) -> list[ResearchRunRead]:
-    stmt = (
-        select(ResearchRun)
-        .order_by(desc(ResearchRun.created_at))
+) -> Response:
+    """
+    Keyset-paginated run list, newest first.
+
+    Pages are keyed on (created_at, id) rather than OFFSET, so every page is
+    an index range scan on ix_research_runs_created_id regardless of depth.
+    """
+    # Only the columns the list view renders; the query text is cut to a
+    # preview so long multi-paragraph prompts don't ride along on every page.
+    stmt = lambda_stmt(
+        lambda: select(
+            ResearchRun.id,
+            ResearchRun.title,
+            func.left(ResearchRun.query, _LIST_QUERY_PREVIEW_CHARS).label("query"),
+            ResearchRun.status,
+            ResearchRun.created_at,
+        )
+        .order_by(ResearchRun.created_at.desc(), ResearchRun.id.desc())
         .limit(limit)
-        .offset(offset)
     )
 
+    if cursor:
+        created_at, last_id = _decode_cursor(cursor)
+        stmt += lambda s: s.where(
+            tuple_(ResearchRun.created_at, ResearchRun.id) < tuple_(created_at, last_id)
+        )
+
     result = await db.execute(stmt)
-    runs = result.scalars().all()
+    runs = list(result.all())
+
+    next_cursor = (
+        _encode_cursor(runs[-1].created_at, runs[-1].id)
+        if runs and len(runs) == limit
+        else None
+    )
+
+    page = ResearchRunPage(items=runs, next_cursor=next_cursor)
 
-    return list(runs)
+    # Straight to JSON bytes through pydantic-core's compiled serializer,
+    # rather than model_dump() to dicts and a second pass through orjson.
+    return _model_response(page)
 
 
 @router.get(
@@ -111,19 +287,26 @@ async def list_research_runs(
 )
 async def get_research_run_detail(
     run_id: UUID,
-    db: AsyncSession = Depends(get_db),
-) -> ResearchRunDetail:
-    orchestrator = PipelineOrchestrator(db=db)
+    request: Request,
+) -> Response:
+    key = run_response_cache.key(run_id, "detail")
+    etag = run_response_cache.etag(run_id)
+
+    cached = _cached_run_response(request, key, etag)
+    if cached is not None:
+        return cached
 
     try:
-        run = await orchestrator.get_run_detail(run_id)
+        body, run_status = await _load_detail_body(run_id, key)
     except RunNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Research run not found",
         )
 
-    return run
+    run_response_cache.set(key, body, run_status)
+
+    return _run_response(body, etag)
 
 
 @router.post(
@@ -133,10 +316,8 @@ async def get_research_run_detail(
 )
 async def execute_dummy_pipeline(
     run_id: UUID,
-    db: AsyncSession = Depends(get_db),
-) -> ResearchRunDetail:
-    orchestrator = PipelineOrchestrator(db=db)
-
+    orchestrator: PipelineOrchestrator = Depends(get_orchestrator),
+) -> Response:
     try:
         run = await orchestrator.execute_dummy_pipeline(run_id)
     except RunNotFoundError:
@@ -150,7 +331,36 @@ async def execute_dummy_pipeline(
             detail=str(exc),
         )
 
-    return run
+    return _model_response(ResearchRunDetail.model_validate(run))
+
+
+@router.post(
+    "/{run_id}/advance",
+    response_model=ResearchRunDetail,
+    status_code=status.HTTP_200_OK,
+)
+async def advance_pipeline(
+    run_id: UUID,
+    orchestrator: PipelineOrchestrator = Depends(get_orchestrator),
+) -> Response:
+    """
+    Idempotently move a run through every remaining dummy stage in one
+    request and one transaction. Already-completed stages are skipped.
+    """
+    try:
+        run = await orchestrator.advance_pipeline(run_id)
+    except RunNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Research run not found",
+        )
+    except InvalidPipelineStateError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(exc),
+        )
+
+    return _model_response(ResearchRunDetail.model_validate(run))
 
 
 @router.post(
@@ -161,10 +371,8 @@ async def execute_dummy_pipeline(
 async def run_web_search(
     run_id: UUID,
     limit: int = 5,
-    db: AsyncSession = Depends(get_db),
-) -> ResearchRunDetail:
-    orchestrator = PipelineOrchestrator(db=db)
-
+    orchestrator: PipelineOrchestrator = Depends(get_orchestrator),
+) -> Response:
     try:
         await orchestrator.run_web_search(run_id, limit=limit)
         run = await orchestrator.get_run_detail(run_id)
@@ -175,7 +383,7 @@ async def run_web_search(
     except Exception:
         raise HTTPException(status_code=502, detail="Search provider failed")
 
-    return run
+    return _model_response(ResearchRunDetail.model_validate(run))
 
 
 @router.post(
@@ -186,10 +394,8 @@ async def run_web_search(
 async def run_web_reader(
     run_id: UUID,
     limit: int = 5,
-    db: AsyncSession = Depends(get_db),
-) -> ResearchRunDetail:
-    orchestrator = PipelineOrchestrator(db=db)
-
+    orchestrator: PipelineOrchestrator = Depends(get_orchestrator),
+) -> Response:
     try:
         await orchestrator.run_web_reader(run_id, limit=limit)
         run = await orchestrator.get_run_detail(run_id)
@@ -200,7 +406,7 @@ async def run_web_reader(
     except Exception:
         raise HTTPException(status_code=502, detail="Reader failed")
 
-    return run
+    return _model_response(ResearchRunDetail.model_validate(run))
 
 
 @router.get(
@@ -210,16 +416,101 @@ async def run_web_reader(
 )
 async def get_research_run_state(
     run_id: UUID,
-    db: AsyncSession = Depends(get_db),
-) -> ResearchRunState:
-    orchestrator = PipelineOrchestrator(db=db)
+    request: Request,
+    orchestrator: PipelineOrchestrator = Depends(get_orchestrator),
+) -> Response:
+    # The UI polls this while a run executes; share the detail endpoint's
+    # versioned cache so repeat polls between writes skip the DB.
+    key = run_response_cache.key(run_id, "state")
+    etag = run_response_cache.etag(run_id)
+
+    cached = _cached_run_response(request, key, etag)
+    if cached is not None:
+        return cached
 
     try:
         payload = await orchestrator.get_run_state(run_id)
     except RunNotFoundError:
         raise HTTPException(status_code=404, detail="Research run not found")
 
-    return payload
+    # get_run_state already returns plain data, so encode it directly rather
+    # than building StepState/ResearchRunState models just to dump them again.
+    # ResearchRunState stays as response_model for the OpenAPI schema.
+    body = orjson.dumps(
+        payload,
+        default=_orjson_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+    )
+    run_response_cache.set(key, body, payload["status"])
+
+    return _run_response(body, etag)
+
+
+@router.get(
+    "/{run_id}/events",
+    status_code=status.HTTP_200_OK,
+)
+async def stream_research_run_events(
+    run_id: UUID,
+    request: Request,
+) -> StreamingResponse:
+    """
+    Server-Sent Events stream of run updates, so clients can watch a run
+    progress without polling /detail. Closes after the pipeline completes
+    or fails.
+    """
+    # Short-lived session: a request-scoped one would pin a pooled
+    # connection for the whole lifetime of the stream.
+    async with AsyncSessionLocal() as db:
+        run = await db.get(ResearchRun, run_id)
+
+    if run is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Research run not found",
+        )
+
+    async def event_source() -> AsyncIterator[bytes]:
+        try:
+            # Subscribe inside the generator so the finally below always
+            # pairs with it, even if the response body never starts.
+            queue = pipeline_event_broker.subscribe(run_id)
+
+            # Re-read the status only after subscribing: a run that finished
+            # earlier will never publish again, and one finishing from here on
+            # is caught by the queue.
+            async with AsyncSessionLocal() as db:
+                current = await db.scalar(
+                    select(ResearchRun.status).where(ResearchRun.id == run_id)
+                )
+            if current in _TERMINAL_RUN_STATUSES:
+                yield b"data: " + orjson.dumps({"type": current.value}) + b"\n\n"
+                return
+
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=15.0)
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield b": keep-alive\n\n"
+                    continue
+
+                yield b"data: " + orjson.dumps(message) + b"\n\n"
+
+                # Runs advanced without execute() finish with a run_updated
+                # message carrying the terminal status instead of an event.
+                if message["type"] in _TERMINAL_MESSAGE_TYPES or (
+                    message.get("status") in _TERMINAL_MESSAGE_TYPES
+                ):
+                    return
+        finally:
+            pipeline_event_broker.unsubscribe(run_id, queue)
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
 
 
 @router.post(
@@ -232,7 +523,7 @@ async def execute_pipeline(
     background_tasks: BackgroundTasks,
     mode: ExecutionMode = ExecutionMode.REAL,
     db: AsyncSession = Depends(get_db),
-) -> ExecutionAccepted:
+) -> Response:
     settings = get_settings()
 
     if mode == ExecutionMode.DUMMY and settings.environment == "production":
@@ -257,12 +548,15 @@ async def execute_pipeline(
     run.status = ResearchRunStatus.RUNNING
     run.error_message = None
     await db.commit()
-    await db.refresh(run)
+    run_response_cache.bump(run_id)
 
     background_tasks.add_task(_execute_pipeline_in_background, run_id, mode)
 
-    return ExecutionAccepted(
-        run_id=run.id,
-        status=run.status,
-        message="Pipeline execution started.",
+    return _model_response(
+        ExecutionAccepted(
+            run_id=run.id,
+            status=run.status,
+            message="Pipeline execution started.",
+        ),
+        status_code=status.HTTP_202_ACCEPTED,
     )
\ No newline at end of file
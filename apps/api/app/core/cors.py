@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+_PREFLIGHT_MAX_AGE = b"600"
+
+
+class FastCORSMiddleware:
+    """
+    Pure-ASGI CORS for a fixed origin allow-list.
+
+    Equivalent to Starlette's CORSMiddleware configured with explicit origins,
+    allow_credentials=True and wildcard methods/headers, but without building
+    Request/Response objects or header dicts per request: origins are matched
+    as raw bytes and the response headers are spliced in as prebuilt tuples.
+    """
+
+    def __init__(self, app: ASGIApp, allow_origins: Iterable[str]) -> None:
+        self.app = app
+        self.allow_origins = frozenset(o.encode("latin-1") for o in allow_origins)
+
+        self._simple_headers: list[tuple[bytes, bytes]] = [
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+        self._preflight_headers: list[tuple[bytes, bytes]] = [
+            (b"access-control-allow-methods", _ALLOW_METHODS),
+            (b"access-control-max-age", _PREFLIGHT_MAX_AGE),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+            (b"content-type", b"text/plain; charset=utf-8"),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin: bytes | None = None
+        request_method: bytes | None = None
+        request_headers: bytes | None = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(origin, request_headers, send)
+            return
+
+        if origin not in self.allow_origins:
+            await self.app(scope, receive, send)
+            return
+
+        extra = [(b"access-control-allow-origin", origin), *self._simple_headers]
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *extra]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _preflight(
+        self,
+        origin: bytes,
+        request_headers: bytes | None,
+        send: Send,
+    ) -> None:
+        if origin in self.allow_origins:
+            status = 200
+            body = b"OK"
+            headers = [(b"access-control-allow-origin", origin), *self._preflight_headers]
+            if request_headers is not None:
+                # Wildcard allow_headers: mirror whatever the browser asked for.
+                headers.append((b"access-control-allow-headers", request_headers))
+        else:
+            status = 400
+            body = b"Disallowed CORS origin"
+            headers = list(self._preflight_headers)
+
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
@@ -1,11 +1,15 @@
 from .base import LLMClient
+from .cache import CachedLLMClient, cached_generate
 from .dummy import DummyLLMClient
-from .factory import get_llm_client
+from .factory import close_llm_client, get_llm_client
 from .ollama import OllamaLLMClient
 
 __all__ = [
     "LLMClient",
     "DummyLLMClient",
     "OllamaLLMClient",
+    "CachedLLMClient",
+    "cached_generate",
     "get_llm_client",
+    "close_llm_client",
 ]
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from typing import Any, Mapping
 
 
@@ -35,3 +36,24 @@ class LLMClient(ABC):
         top_p, etc.). Implementations should treat unknown options leniently.
         """
         ...
+
+    async def stream(
+        self,
+        *,
+        prompt: str,
+        options: Mapping[str, Any] | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Yield the completion in chunks as the provider produces them.
+
+        Defaults to a single chunk from generate(), so providers without
+        streaming support (and wrappers like the response cache) still work.
+        """
+        yield await self.generate(prompt=prompt, options=options)
+
+    async def aclose(self) -> None:
+        """
+        Release any resources (e.g. pooled HTTP connections) held by the client.
+        No-op by default.
+        """
+        return None
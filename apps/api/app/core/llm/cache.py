@@ -0,0 +1,113 @@
+import asyncio
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Mapping
+
+import orjson
+
+from .base import LLMClient
+
+
+def _cache_key(
+    client: LLMClient,
+    prompt: str,
+    options: Mapping[str, Any] | None,
+) -> str:
+    options_json = json.dumps(dict(options or {}), sort_keys=True)
+    raw = f"{client.provider_name}:{client.model_name}:{options_json}:{prompt}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _read_entry(path: Path) -> dict[str, Any] | None:
+    try:
+        return orjson.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_entry(path: Path, entry: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write-then-rename so a concurrent reader never sees a partial file.
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_bytes(orjson.dumps(entry))
+    os.replace(tmp_path, path)
+
+
+async def cached_generate(
+    client: LLMClient,
+    *,
+    prompt: str,
+    options: Mapping[str, Any] | None = None,
+    cache_dir: str | Path,
+) -> str:
+    """
+    Content-addressed, on-disk cache around client.generate().
+
+    Entries are keyed by (provider, model, options, prompt) and stored as one
+    JSON file each, so identical prompts during dev/test runs skip the model
+    call entirely.
+    """
+    key = _cache_key(client, prompt, options)
+    path = Path(cache_dir) / key[:2] / f"{key}.json"
+
+    entry = await asyncio.to_thread(_read_entry, path)
+    if entry is not None and isinstance(entry.get("response"), str):
+        return entry["response"]
+
+    response = await client.generate(prompt=prompt, options=options)
+
+    try:
+        await asyncio.to_thread(
+            _write_entry,
+            path,
+            {
+                "response": response,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "provider": client.provider_name,
+                "model_version": client.model_name,
+            },
+        )
+    except OSError:
+        # Caching is best-effort; never fail a generation because of it.
+        pass
+
+    return response
+
+
+class CachedLLMClient(LLMClient):
+    """
+    LLMClient wrapper that serves repeated prompts from the on-disk cache.
+    Enabled via the `llm_cache_enabled` setting.
+    """
+
+    def __init__(self, inner: LLMClient, cache_dir: str | Path) -> None:
+        self._inner = inner
+        self._cache_dir = cache_dir
+
+    @property
+    def provider_name(self) -> str:
+        return self._inner.provider_name
+
+    @property
+    def model_name(self) -> str:
+        return self._inner.model_name
+
+    async def generate(
+        self,
+        *,
+        prompt: str,
+        options: Mapping[str, Any] | None = None,
+    ) -> str:
+        return await cached_generate(
+            self._inner,
+            prompt=prompt,
+            options=options,
+            cache_dir=self._cache_dir,
+        )
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
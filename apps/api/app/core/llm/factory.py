@@ -3,6 +3,7 @@ from functools import lru_cache
 from app.core.config import get_settings
 
 from .base import LLMClient
+from .cache import CachedLLMClient
 from .dummy import DummyLLMClient
 from .ollama import OllamaLLMClient
 
@@ -14,7 +15,8 @@ def get_llm_client() -> LLMClient:
 
     Supported providers:
     - 'dummy' (or 'dev'): in-memory echo-style client
-    - 'ollama': local Ollama server via HTTP
+    - 'ollama': local Ollama server via HTTP (optionally behind the on-disk
+      response cache when `llm_cache_enabled` is set)
 
     Future:
     - 'openai' and others can be added here.
@@ -27,12 +29,29 @@ def get_llm_client() -> LLMClient:
 
     if provider == "ollama":
         # Use the configured base URL and model name
-        return OllamaLLMClient(
+        client: LLMClient = OllamaLLMClient(
             base_url=settings.ollama_base_url,
             model=settings.llm_model,
         )
 
+        if settings.llm_cache_enabled:
+            client = CachedLLMClient(client, cache_dir=settings.llm_cache_dir)
+
+        return client
+
     raise ValueError(
         f"Unsupported LLM provider: {provider!r}. "
         "Currently supported: 'dummy', 'ollama'."
     )
+
+
+async def close_llm_client() -> None:
+    """
+    Close the cached LLM client, if one was ever created.
+    Called on app shutdown.
+    """
+    if get_llm_client.cache_info().currsize == 0:
+        return
+
+    await get_llm_client().aclose()
+    get_llm_client.cache_clear()
@@ -1,6 +1,8 @@
+from collections.abc import AsyncIterator
 from typing import Any, Mapping
 
 import httpx
+import orjson
 
 from app.core.config import get_settings
 
@@ -14,14 +16,23 @@ class OllamaLLMClient(LLMClient):
     Expects an Ollama server running (by default) on http://localhost:11434.
 
     API reference (simplified):
-    - POST /api/generate
-      { "model": "...", "prompt": "...", "stream": false }
+    - POST /api/chat
+      { "model": "...", "messages": [...], "stream": false }
+      With "stream": true the reply is NDJSON, one message chunk per line.
     """
 
     def __init__(self, base_url: str, model: str) -> None:
         self._base_url = base_url.rstrip("/")
         self._model = model
 
+        # One long-lived client so every generate() call reuses pooled
+        # keep-alive connections instead of reconnecting each time.
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url,
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
+
     @property
     def provider_name(self) -> str:
         return "ollama"
@@ -30,14 +41,13 @@ class OllamaLLMClient(LLMClient):
     def model_name(self) -> str:
         return self._model
 
-    async def generate(
+    def _chat_payload(
         self,
-        *,
         prompt: str,
-        options: Mapping[str, Any] | None = None,
-    ) -> str:
-        url = f"{self._base_url}/api/chat"
-
+        options: Mapping[str, Any] | None,
+        *,
+        stream: bool,
+    ) -> dict[str, Any]:
         payload: dict[str, Any] = {
             "model": self._model,
             "messages": [
@@ -50,7 +60,7 @@ class OllamaLLMClient(LLMClient):
                     "content": prompt,
                 },
             ],
-            "stream": False,
+            "stream": stream,
         }
 
         if options:
@@ -67,10 +77,19 @@ class OllamaLLMClient(LLMClient):
                 payload["options"] = payload.get("options", {})
                 payload["options"]["num_predict"] = max_tokens
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            res = await client.post(url, json=payload)
-            res.raise_for_status()
-            data = res.json()
+        return payload
+
+    async def generate(
+        self,
+        *,
+        prompt: str,
+        options: Mapping[str, Any] | None = None,
+    ) -> str:
+        payload = self._chat_payload(prompt, options, stream=False)
+
+        res = await self._client.post("/api/chat", json=payload)
+        res.raise_for_status()
+        data = orjson.loads(res.content)
 
         # Chat endpoint response shape
         message = data.get("message", {})
@@ -80,3 +99,28 @@ class OllamaLLMClient(LLMClient):
             content = str(content)
 
         return content
+
+    async def stream(
+        self,
+        *,
+        prompt: str,
+        options: Mapping[str, Any] | None = None,
+    ) -> AsyncIterator[str]:
+        payload = self._chat_payload(prompt, options, stream=True)
+
+        async with self._client.stream("POST", "/api/chat", json=payload) as res:
+            res.raise_for_status()
+            async for line in res.aiter_lines():
+                if not line:
+                    continue
+                data = orjson.loads(line)
+
+                content = data.get("message", {}).get("content", "")
+                if content:
+                    yield content if isinstance(content, str) else str(content)
+
+                if data.get("done"):
+                    break
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
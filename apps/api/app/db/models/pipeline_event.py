@@ -2,7 +2,7 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, Integer, Text, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, String, Integer, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -22,6 +22,9 @@ class ExecutionMode(str, enum.Enum):
 
 class PipelineEvent(Base):
     __tablename__ = "pipeline_events"
+    __table_args__ = (
+        Index("ix_pipeline_events_run_created", "run_id", "created_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -1,8 +1,8 @@
 import enum
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, Enum, String, Text, func
+from sqlalchemy import DateTime, Enum, Index, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -16,8 +16,16 @@ class ResearchRunStatus(str, enum.Enum):
     FAILED = "failed"
 
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class ResearchRun(Base):
     __tablename__ = "research_runs"
+    __table_args__ = (
+        # Backs keyset pagination on the runs list (created_at desc, id desc).
+        Index("ix_research_runs_created_id", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -42,16 +50,20 @@ class ResearchRun(Base):
 
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
+    # Python-side defaults so timestamps are known in memory after INSERT and
+    # callers don't need a refresh round trip; server defaults stay for raw SQL.
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        default=_utcnow,
         server_default=func.now(),
         nullable=False,
     )
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        default=_utcnow,
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=_utcnow,
         nullable=False,
     )
 
@@ -2,8 +2,8 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, JSON, func, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, func, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -25,6 +25,13 @@ class ResearchStepStatus(str, enum.Enum):
     
 class ResearchStep(Base):
     __tablename__ = "research_steps"
+    __table_args__ = (
+        # MAX(step_index) per run: index-only scan, read backward.
+        Index("ix_research_steps_run_idx", "run_id", "step_index"),
+        # One step per type per run. Serves the stage-gate lookups and is the
+        # ON CONFLICT target for step inserts.
+        Index("uq_research_steps_run_type", "run_id", "step_type", unique=True),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -66,8 +73,8 @@ class ResearchStep(Base):
         nullable=True,
     )
 
-    input: Mapped[dict | None] = mapped_column(JSON, nullable=True)
-    output: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    input: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    output: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -10,6 +10,11 @@ from app.db.base import Base
 
 class Source(Base):
     __tablename__ = "sources"
+    __table_args__ = (
+        # Postgres doesn't index foreign keys itself; every sources load
+        # (selectinload on the run, per-run lookups) filters on run_id.
+        Index("ix_sources_run_id", "run_id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
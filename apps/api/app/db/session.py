@@ -1,5 +1,9 @@
 from collections.abc import AsyncGenerator
+from typing import Any
 
+import orjson
+from sqlalchemy import URL, make_url
+from sqlalchemy.pool import NullPool
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -10,11 +14,51 @@ from app.core.config import get_settings
 
 settings = get_settings()
 
+
+def _json_serializer(obj: Any) -> str:
+    return orjson.dumps(obj).decode("utf-8")
+
+
+def _pool_options() -> dict[str, Any]:
+    if settings.db_use_pgbouncer:
+        # PgBouncer (transaction mode) already pools server connections, and a
+        # second pool here would pin them. Prepared statements don't survive
+        # connection hand-offs, so asyncpg's statement cache is disabled too.
+        return {
+            "poolclass": NullPool,
+            "connect_args": {"statement_cache_size": 0},
+        }
+
+    return {
+        # Explicit pool sizing so concurrent requests + background pipeline
+        # runs don't queue on the default 5+10 pool and time out.
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        # Recycle before Postgres/proxies drop idle connections, rather than
+        # paying a pre-ping round trip on every checkout (opt-in via settings).
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+def _database_url() -> URL:
+    url = make_url(settings.database_url)
+    if settings.db_use_pgbouncer:
+        url = url.update_query_dict({"prepared_statement_cache_size": "0"})
+    return url
+
+
 # Create async engine using DATABASE_URL from settings
 engine = create_async_engine(
-    settings.database_url,
+    _database_url(),
     echo=False,   # set True if you want to see SQL in logs while debugging
     future=True,
+    # The asyncpg dialect registers its json/jsonb codecs with these, so all
+    # JSON/JSONB columns encode and decode through orjson.
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    **_pool_options(),
 )
 
 # Factory for async sessions
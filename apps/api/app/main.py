@@ -1,35 +1,56 @@
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
+
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import get_settings
+from app.core.cors import FastCORSMiddleware
+from app.core.llm import close_llm_client
+from app.services.search_clients.duckduckgo_client import close_search_client
+from app.services.web_fetcher import close_reader_client
 from app.api.router import api_router
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Shut down pooled connections held by long-lived clients
+    await close_llm_client()
+    await close_search_client()
+    await close_reader_client()
+
+
 app = FastAPI(
     title=settings.api_name,
     version=settings.api_version,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS: allow local frontend dev (Vite default port 5173)
 app.add_middleware(
-    CORSMiddleware,
+    FastCORSMiddleware,
     allow_origins=[
         "http://localhost:5173",
         "http://127.0.0.1:5173",
     ],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
 )
 
 # Include API router under /api
 app.include_router(api_router, prefix="/api")
 
 
+# The health payload never changes for the life of the process, so it is
+# serialized once here instead of on every probe.
+_HEALTH_BODY = orjson.dumps({"status": "ok", "version": settings.api_version})
+
+
 @app.get("/health", tags=["system"])
 async def health_check():
     """
     Simple health check endpoint to verify the API is running.
     """
-    return {"status": "ok", "version": settings.api_version}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
@@ -42,6 +42,32 @@ class ResearchRunRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ResearchRunSummary(BaseModel):
+    """
+    Slim run representation for list views.
+    `query` may be truncated to a short preview.
+    """
+
+    id: UUID
+    title: str | None
+    query: str
+    status: ResearchRunStatus
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ResearchRunPage(BaseModel):
+    """
+    One page of research runs, newest first.
+    Pass `next_cursor` back as `cursor` to fetch the following page;
+    it is None once there are no more runs.
+    """
+
+    items: list[ResearchRunSummary]
+    next_cursor: str | None = None
+
+
 class ResearchStepRead(BaseModel):
     id: UUID
     run_id: UUID
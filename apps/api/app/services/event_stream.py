@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from uuid import UUID
+
+# Bounded so a stalled SSE client can't grow memory without limit; when full,
+# the oldest message is dropped (clients only need the latest state anyway).
+_QUEUE_MAXSIZE = 100
+
+
+class PipelineEventBroker:
+    """
+    In-process fan-out of run updates to Server-Sent Events subscribers.
+
+    The orchestrator publishes after each commit, so subscribers are told
+    about step progress and pipeline events as they land instead of polling
+    /detail. Like the response cache, this relies on pipeline writes running
+    in the same process as the API (the background-task executor).
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: dict[UUID, set[asyncio.Queue[dict[str, Any]]]] = {}
+
+    def subscribe(self, run_id: UUID) -> asyncio.Queue[dict[str, Any]]:
+        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
+        self._subscribers.setdefault(run_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, run_id: UUID, queue: asyncio.Queue[dict[str, Any]]) -> None:
+        queues = self._subscribers.get(run_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[run_id]
+
+    def publish(self, run_id: UUID, message: dict[str, Any]) -> None:
+        for queue in self._subscribers.get(run_id, ()):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(message)
+
+
+pipeline_event_broker = PipelineEventBroker()
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from typing import Any
 from uuid import UUID
-import json
 import httpx
+import orjson
 import re
+import time
 
-from sqlalchemy import select
+from sqlalchemy import ScalarSelect, exists, func, insert, inspect, lambda_stmt, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, load_only, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.db.models import (
     ResearchRun,
@@ -23,15 +27,236 @@ from app.db.models import (
     Answer
 )
 from datetime import datetime, timezone
-from app.services.search_clients.duckduckgo_client import DuckDuckGoClient
-from app.services.web_fetcher import fetch_html, extract_text_from_html, basic_summary, UnsafeUrlError
+from app.services.search_clients.duckduckgo_client import get_search_client
+from app.services.web_fetcher import (
+    fetch_html,
+    basic_summary,
+    extract_text_from_html,
+    get_reader_client,
+    UnsafeUrlError,
+)
+from app.services.run_cache import run_response_cache
+from app.services.event_stream import pipeline_event_broker
 from app.schemas.execution import ExecutionMode
 from app.core.llm import LLMClient, get_llm_client
 from app.schemas.synthesis import SynthesisOutput
 
-from bs4 import BeautifulSoup
-
 _SYNTHESIS_SOURCE_LIMIT = 3
+_SYNTHESIS_EVIDENCE_CHARS = 1800
+
+# Publish an SSE progress message every this many streamed LLM chunks
+# (Ollama sends roughly one token per chunk).
+_SYNTHESIS_PROGRESS_EVERY = 32
+
+# Web reader time limits: per page (fetch + parse) and for the whole batch,
+# so one slow host can't hold the step open for long.
+_READER_PAGE_TIMEOUT_S = 12.0
+_READER_BUDGET_S = 30.0
+
+# Fixed instructions for the LLM synthesis prompt; only the question and the
+# source context are appended per run.
+_SYNTHESIS_PROMPT_PREFIX = """You are an expert research assistant helping someone make a real decision.
+
+GOAL:
+Produce a high-quality, practical answer using the provided evidence sources.
+
+REQUIREMENTS:
+
+1. Use MULTIPLE sources where possible (not just one).
+2. Every key point and every risk MUST include citations like [1], [2], etc.
+3. Do not repeat the same source for everything — aim for coverage across sources.
+4. Be specific and concrete. Avoid vague or generic statements.
+
+OUTPUT FORMAT (follow EXACTLY):
+
+SUMMARY:
+A concise but clear answer to the question.
+
+KEY POINTS:
+- A meaningful point supported by evidence [n]
+- Another point supported by evidence [n]
+
+RISKS:
+- A real downside or uncertainty [n]
+- Another risk [n]
+
+RECOMMENDATION:
+Give a clear, well-written, and actionable recommendation.
+
+Structure:
+- Write in 2–4 complete sentences.
+- Use proper punctuation and sentence breaks.
+- Do NOT use bullet points or dashes.
+- Each sentence should express one clear idea.
+
+Content:
+- Include 1–2 concrete actions the user should take next
+- Include a condition under which they SHOULD quit
+- Include a condition under which they should NOT quit
+
+Rules:
+- Write natural, readable English (like a human advisor)
+- Do NOT include the word "CONFIDENCE"
+- Do NOT include any numeric score
+- Do NOT include labels or formatting artifacts
+
+CONFIDENCE:
+Write exactly one number between 0.0 and 1.0 on the next line.
+Example:
+CONFIDENCE:
+0.72
+
+---
+
+GUIDELINES:
+- Prefer using multiple high-relevance sources from the provided set
+- If sources disagree, mention that
+- If evidence is weak, reflect that in the confidence score
+- Do NOT invent facts — only use provided summaries
+- Avoid using hyphens or bullet-style formatting inside paragraphs.
+---
+
+"""
+
+_DUMMY_ANSWER_PREFIX = "This is a dummy synthesized answer based on the attached sources.\n\n"
+_DUMMY_ANSWER_SUFFIX = (
+    "A proper LLM-backed synthesizer will later read and compare these "
+    "sources in detail to produce a nuanced, citation-rich answer."
+)
+
+# (url prefix, url suffix, title, summary, relevance_score, metadata) for the
+# dummy searcher's fixed sources. The metadata dicts are shared across runs and
+# only ever serialized, never mutated. They stay plain dicts (not
+# MappingProxyType) because the JSON column serializer only accepts dicts.
+_DUMMY_SOURCE_TEMPLATES: tuple[tuple[str, str, str, str, float, dict], ...] = (
+    (
+        "https://example.com/articles/",
+        "-overview",
+        "High-level overview related to your research question",
+        "Overview article (dummy source for dev/testing).",
+        0.9,
+        {"source_type": "overview", "dummy": True},
+    ),
+    (
+        "https://example.com/blog/",
+        "-tradeoffs",
+        "Discussion of tradeoffs and practical considerations",
+        "Tradeoffs and pros/cons (dummy source for dev/testing).",
+        0.8,
+        {"source_type": "discussion", "dummy": True},
+    ),
+    (
+        "https://example.com/docs/",
+        "-reference",
+        "Reference documentation or spec-style material",
+        "Reference-style material (dummy source for dev/testing).",
+        0.75,
+        {"source_type": "reference", "dummy": True},
+    ),
+)
+
+# Characters btrim() strips when counting non-blank summaries in SQL.
+_WHITESPACE = " \t\n\r\f\v"
+
+# Same for every web search row; shared like the dummy templates' metadata.
+_WEB_SOURCE_METADATA = {"provider": "duckduckgo_html"}
+
+# Loader options are immutable, so build them once at import rather than on
+# every call.
+#
+# Every loader ends in raiseload("*"): a relationship the caller didn't ask
+# for raises immediately instead of lazy-loading (which fails under asyncio
+# anyway, and would be a hidden extra round trip if it didn't). Code that
+# starts reading a new relationship must add it to the matching tuple here.
+_DETAIL_LOAD_OPTIONS = (
+    joinedload(ResearchRun.steps),
+    joinedload(ResearchRun.answer),
+    selectinload(ResearchRun.sources),
+    selectinload(ResearchRun.events),
+    raiseload("*"),
+)
+# /state only reports step progress and source counts, so skip the step
+# input/output JSON, the events/answer, and the sources entirely (they are
+# counted in SQL instead).
+_STATE_LOAD_OPTIONS = (
+    joinedload(ResearchRun.steps).load_only(
+        ResearchStep.step_index,
+        ResearchStep.step_type,
+        ResearchStep.status,
+        ResearchStep.started_at,
+        ResearchStep.completed_at,
+        ResearchStep.error_message,
+    ),
+    raiseload("*"),
+)
+_STAGE_LOAD_OPTIONS = (joinedload(ResearchRun.steps), raiseload("*"))
+
+# Columns the web reader reads on each unread source (it only writes the rest).
+_READER_SOURCE_OPTIONS = (load_only(Source.id, Source.url, Source.title),)
+
+# Synthesis ranks on summary/relevance and only quotes the first
+# _SYNTHESIS_EVIDENCE_CHARS of raw_content, which is selected separately
+# (trimmed and truncated server-side) instead of shipping the full page text.
+_SYNTHESIS_SOURCE_OPTIONS = (
+    load_only(Source.id, Source.url, Source.title, Source.summary, Source.relevance_score),
+)
+
+# Columns the dummy reader/synthesis stages touch on each source.
+_DUMMY_STAGE_SOURCE_OPTIONS = (
+    load_only(Source.id, Source.url, Source.title, Source.summary),
+)
+
+
+def _next_step_index_from_loaded(run: ResearchRun) -> int:
+    # For runs loaded via _load_run_with_steps: run.steps is already in
+    # memory, so there's no need for the MAX(step_index) query.
+    return max((step.step_index for step in run.steps), default=-1) + 1
+
+
+_CITATION_RE = re.compile(r"\[(\d+)\]")
+
+_SLUG_TABLE = str.maketrans(" ", "-")
+
+
+def _dummy_slug(query: str) -> str:
+    # Slice before lowering so long queries aren't copied in full; the second
+    # slice only matters for the few characters that lowercase to two.
+    return query[:50].lower().translate(_SLUG_TABLE)[:50] or "research-topic"
+
+
+def _compact(text: str, max_chars: int) -> str:
+    # Callers pass already-stripped text, so there's no copy here unless it
+    # actually needs truncating.
+    if len(text) <= max_chars:
+        return text
+    return text[: max_chars - 20].rstrip() + " ...[truncated]"
+
+
+def _dummy_source_rows(run_id: UUID, query: str) -> list[dict[str, Any]]:
+    """
+    Insert rows for the dummy searcher's sources.
+    """
+    base_slug = _dummy_slug(query)
+    return [
+        {
+            "run_id": run_id,
+            "url": url_prefix + base_slug + url_suffix,
+            "title": title,
+            "raw_content": None,
+            "summary": summary,
+            "relevance_score": relevance_score,
+            "extra_metadata": extra_metadata,
+        }
+        for url_prefix, url_suffix, title, summary, relevance_score, extra_metadata in _DUMMY_SOURCE_TEMPLATES
+    ]
+
+
+def _dummy_source_entry(idx: int, src: Source) -> str:
+    summ = (src.summary or "").strip()
+    if summ:
+        return f"{idx}. {src.title or src.url} — {src.url}\n   Summary: {summ}"
+    return f"{idx}. {src.title or src.url} — {src.url}"
+
 
 class RunNotFoundError(Exception):
     pass
@@ -111,7 +336,6 @@ def _parse_structured_synthesis_text(text: str) -> dict:
     }
 
 
-@dataclass(frozen=True)
 class PipelineOrchestrator:
     """
     Central place for pipeline orchestration rules.
@@ -119,63 +343,210 @@ class PipelineOrchestrator:
     Goal: keep route handlers thin and keep business rules testable and consistent.
     """
 
-    db: AsyncSession
+    # One instance per request: slots skip the per-instance __dict__.
+    __slots__ = ("db",)
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
 
     async def get_run_detail(self, run_id: UUID) -> ResearchRun:
         """
         Canonical detail loader: run + steps + sources + answer.
+
+        Steps (a handful per run) and the single answer ride along on the
+        parent query via JOIN. Sources and events stay on selectinload: joining
+        a second collection would multiply rows (steps x sources).
+
+        populate_existing: stages insert steps without appending to an
+        already-loaded run.steps, so the cached collections must be replaced.
         """
-        stmt = (
-            select(ResearchRun)
-            .options(
-                selectinload(ResearchRun.steps),
-                selectinload(ResearchRun.sources),
-                selectinload(ResearchRun.answer),
-                selectinload(ResearchRun.events),
-            )
+        stmt = lambda_stmt(
+            lambda: select(ResearchRun)
+            .options(*_DETAIL_LOAD_OPTIONS)
             .where(ResearchRun.id == run_id)
+            .execution_options(populate_existing=True)
         )
 
         result = await self.db.execute(stmt)
-        run = result.scalar_one_or_none()
+        # unique() collapses the joined step rows; the PK filter guarantees
+        # at most one run, so first() skips the extra-row check.
+        run = result.unique().scalars().first()
         if run is None:
             raise RunNotFoundError("Research run not found")
         return run
 
-    async def _has_step_type(self, run_id: UUID, step_type: ResearchStepType) -> bool:
-        stmt = select(ResearchStep.id).where(
-            ResearchStep.run_id == run_id,
-            ResearchStep.step_type == step_type,
+    async def _load_run_with_steps(
+        self,
+        run_id: UUID,
+    ) -> ResearchRun:
+        """
+        Run + steps in one joined query, so a stage can derive its gates from
+        run.steps instead of probing separately.
+
+        populate_existing: the run may already sit in the identity map with
+        collections loaded by an earlier stage, which added rows since.
+        """
+        stmt = lambda_stmt(
+            lambda: select(ResearchRun)
+            .options(*_STAGE_LOAD_OPTIONS)
+            .where(ResearchRun.id == run_id)
+            .execution_options(populate_existing=True)
         )
         result = await self.db.execute(stmt)
-        return result.scalar_one_or_none() is not None
+        run = result.unique().scalars().first()
+        if run is None:
+            raise RunNotFoundError("Research run not found")
+        return run
 
-    async def _has_completed_step_type(
+    async def _existing_step_types(
         self,
         run_id: UUID,
-        step_type: ResearchStepType,
-    ) -> bool:
-        stmt = select(ResearchStep.id).where(
-            ResearchStep.run_id == run_id,
-            ResearchStep.step_type == step_type,
-            ResearchStep.status == ResearchStepStatus.COMPLETED,
+    ) -> tuple[set[ResearchStepType], set[ResearchStepType]]:
+        """
+        One query for every stage gate: returns (step types present in any
+        status, step types with at least one COMPLETED step).
+
+        uq_research_steps_run_type allows one step per type, so this reads at
+        most four rows off the index; no DISTINCT/array_agg is needed.
+        """
+        result = await self.db.execute(
+            lambda_stmt(
+                lambda: select(ResearchStep.step_type, ResearchStep.status).where(
+                    ResearchStep.run_id == run_id
+                )
+            )
+        )
+        existing: set[ResearchStepType] = set()
+        completed: set[ResearchStepType] = set()
+        for step_type, step_status in result.all():
+            existing.add(step_type)
+            if step_status == ResearchStepStatus.COMPLETED:
+                completed.add(step_type)
+        return existing, completed
+
+    async def _commit(self, run_id: UUID, *, event: PipelineEvent | None = None) -> None:
+        """
+        Commit, invalidate any cached API responses for the run, and notify
+        SSE subscribers (with the pipeline event, if this commit recorded one).
+        """
+        await self.db.commit()
+        run_response_cache.bump(run_id)
+
+        if event is None:
+            # Every committing path has the run in the session already; read
+            # its status from the identity map (no SQL) so subscribers can
+            # tell when a run without pipeline events has finished.
+            run = self.db.identity_map.get(self.db.identity_key(ResearchRun, run_id))
+            message: dict[str, Any] = {"type": "run_updated"}
+            if run is not None:
+                message["status"] = run.status.value
+            pipeline_event_broker.publish(run_id, message)
+        else:
+            pipeline_event_broker.publish(
+                run_id,
+                {
+                    "type": event.event_type.value,
+                    "mode": event.mode.value,
+                    "stage": event.stage,
+                    "duration_ms": event.duration_ms,
+                    "error_message": event.error_message,
+                },
+            )
+
+    async def _insert_step(self, **values: Any) -> None:
+        # Core INSERT: callers never read the step object back, so there is
+        # nothing for the unit of work to track, flush or refresh.
+        #
+        # The stage gates are checked in memory beforehand; ON CONFLICT on
+        # uq_research_steps_run_type covers a concurrent request that added
+        # the same stage in between, without an extra SELECT.
+        stmt = (
+            pg_insert(ResearchStep)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=["run_id", "step_type"])
+            .returning(ResearchStep.id)
         )
         result = await self.db.execute(stmt)
-        return result.scalar_one_or_none() is not None
-    
-    async def _set_status_running_if_pending(self, run: ResearchRun) -> None:
-        if run.status == ResearchRunStatus.PENDING:
-            run.status = ResearchRunStatus.RUNNING
+        if result.first() is None:
+            raise InvalidPipelineStateError(
+                f"{values['step_type'].value.capitalize()} step has already been "
+                "run for this research run."
+            )
 
-    async def _set_status_completed(self, run: ResearchRun) -> None:
-        run.status = ResearchRunStatus.COMPLETED
+    async def _finish_dummy_step(self, run: ResearchRun, *, commit: bool) -> None:
+        if commit:
+            # No refresh: expire_on_commit is off and every column the stages
+            # touch (status, updated_at) is set client-side.
+            await self._commit(run.id)
+        else:
+            # Caller owns the transaction; flush so the next stage's queries
+            # see these rows (autoflush is off).
+            await self.db.flush()
 
-    async def _next_step_index(self, run_id: UUID) -> int:
-        result = await self.db.execute(
-            select(ResearchStep.step_index).where(ResearchStep.run_id == run_id)
+    async def _update_status(
+        self,
+        run: ResearchRun,
+        status: ResearchRunStatus,
+        *,
+        only_from: ResearchRunStatus | None = None,
+        at: datetime | None = None,
+    ) -> None:
+        """
+        Explicit single-row UPDATE instead of dirtying the ORM object. With
+        `only_from`, the WHERE clause makes the transition idempotent. `at`
+        lets a stage stamp updated_at with the timestamp it already took.
+
+        RETURNING hands back the row as written in the same round trip, so
+        the loaded run is only touched when the UPDATE actually matched.
+        """
+        stmt = (
+            update(ResearchRun)
+            .where(ResearchRun.id == run.id)
+            .values(status=status, updated_at=at or datetime.now(timezone.utc))
+            .returning(ResearchRun.status, ResearchRun.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        if only_from is not None:
+            stmt = stmt.where(ResearchRun.status == only_from)
+        row = (await self.db.execute(stmt)).first()
+        if row is None:
+            return
+
+        # Mirror the write onto the loaded run without scheduling another flush.
+        set_committed_value(run, "status", row.status)
+        set_committed_value(run, "updated_at", row.updated_at)
+
+    async def _set_status_running_if_pending(
+        self,
+        run: ResearchRun,
+        *,
+        at: datetime | None = None,
+    ) -> None:
+        if run.status == ResearchRunStatus.PENDING:
+            await self._update_status(
+                run,
+                ResearchRunStatus.RUNNING,
+                only_from=ResearchRunStatus.PENDING,
+                at=at,
+            )
+
+    async def _set_status_completed(
+        self,
+        run: ResearchRun,
+        *,
+        at: datetime | None = None,
+    ) -> None:
+        await self._update_status(run, ResearchRunStatus.COMPLETED, at=at)
+
+    def _next_step_index_expr(self, run_id: UUID) -> ScalarSelect[int]:
+        # Scalar subquery for the step INSERT itself, so the index is computed
+        # server-side (index-only scan on ix_research_steps_run_idx) in the same
+        # round trip as the write instead of a separate SELECT beforehand.
+        return (
+            select(func.coalesce(func.max(ResearchStep.step_index) + 1, 0))
+            .where(ResearchStep.run_id == run_id)
+            .scalar_subquery()
         )
-        indices = list(result.scalars().all())
-        return (max(indices) + 1) if indices else 0
     
     def _build_fallback_search_query(self, query: str) -> str:
         cleaned = query.strip().lower()
@@ -292,37 +663,42 @@ class PipelineOrchestrator:
 
         return t.strip()
     
-    async def run_dummy_search(self, run_id: UUID) -> ResearchRun:
+    async def run_dummy_search(
+        self,
+        run: ResearchRun,
+        *,
+        commit: bool = True,
+        existing: set[ResearchStepType] | None = None,
+    ) -> ResearchRun:
         """
         Orchestrated dummy search:
         - validates pipeline state
         - appends search step + sources (via existing behavior)
         - transitions status to RUNNING
         """
-        run = await self.db.get(ResearchRun, run_id)
-        if run is None:
-            raise RunNotFoundError("Research run not found")
+        run_id = run.id
+
+        if existing is None:
+            existing, _ = await self._existing_step_types(run_id)
 
         # Rule: don't run search twice (keeps UI and pipeline clean)
-        already_searched = await self._has_step_type(run_id, ResearchStepType.SEARCHER)
+        already_searched = ResearchStepType.SEARCHER in existing
         if already_searched:
             raise InvalidPipelineStateError("Search has already been run for this research run.")
 
         # Rule: planner should exist first (it should, but enforce)
-        has_planner = await self._has_step_type(run_id, ResearchStepType.PLANNER)
+        has_planner = ResearchStepType.PLANNER in existing
         if not has_planner:
             raise InvalidPipelineStateError("Planner step missing; cannot run search.")
 
         # --- Existing dummy behavior (inline, intentionally small) ---
         query = run.query
 
-        next_index = await self._next_step_index(run_id)
-
         now = datetime.now(timezone.utc)
 
-        search_step = ResearchStep(
+        await self._insert_step(
             run_id=run.id,
-            step_index=next_index,
+            step_index=self._next_step_index_expr(run.id),
             step_type=ResearchStepType.SEARCHER,
             status=ResearchStepStatus.COMPLETED,
             started_at=now,
@@ -333,69 +709,55 @@ class PipelineOrchestrator:
                 "hint": "Later this will hit a search API and populate real sources.",
             },
         )
-        self.db.add(search_step)
-
-        base_slug = query.lower().replace(" ", "-")[:50] or "research-topic"
-        sources = [
-            Source(
-                run_id=run.id,
-                url=f"https://example.com/articles/{base_slug}-overview",
-                title="High-level overview related to your research question",
-                raw_content=None,
-                summary="Overview article (dummy source for dev/testing).",
-                relevance_score=0.9,
-                extra_metadata={"source_type": "overview", "dummy": True},
-            ),
-            Source(
-                run_id=run.id,
-                url=f"https://example.com/blog/{base_slug}-tradeoffs",
-                title="Discussion of tradeoffs and practical considerations",
-                raw_content=None,
-                summary="Tradeoffs and pros/cons (dummy source for dev/testing).",
-                relevance_score=0.8,
-                extra_metadata={"source_type": "discussion", "dummy": True},
-            ),
-            Source(
-                run_id=run.id,
-                url=f"https://example.com/docs/{base_slug}-reference",
-                title="Reference documentation or spec-style material",
-                raw_content=None,
-                summary="Reference-style material (dummy source for dev/testing).",
-                relevance_score=0.75,
-                extra_metadata={"source_type": "reference", "dummy": True},
-            ),
-        ]
-        self.db.add_all(sources)
+        if existing is not None:
+            existing.add(ResearchStepType.SEARCHER)
+
+        rows = _dummy_source_rows(run.id, query)
+        # One multi-row INSERT ... RETURNING instead of a unit-of-work INSERT
+        # per object; the returned Sources are already in the identity map.
+        result = await self.db.scalars(insert(Source).returning(Source), rows)
+        sources = list(result.all())
+
+        # Keep run.sources current for the reader/synthesis stages without
+        # marking the collection dirty.
+        set_committed_value(run, "sources", [*run.sources, *sources])
         # --- end existing dummy behavior ---
 
-        await self._set_status_running_if_pending(run)
+        await self._set_status_running_if_pending(run, at=now)
 
-        await self.db.commit()
-        await self.db.refresh(run)
+        await self._finish_dummy_step(run, commit=commit)
         return run
 
-    async def run_dummy_synthesis(self, run_id: UUID) -> ResearchRun:
+    async def run_dummy_synthesis(
+        self,
+        run: ResearchRun,
+        *,
+        commit: bool = True,
+        existing: set[ResearchStepType] | None = None,
+    ) -> ResearchRun:
         """
         Orchestrated dummy synthesis:
         - requires search to have run
         - prevents duplicate synthesis
         - transitions status to COMPLETED
+
+        Reads the sources from `run.sources`, so the caller must pass a run
+        with that collection loaded (advance_pipeline does).
         """
-        run = await self.db.get(ResearchRun, run_id)
-        if run is None:
-            raise RunNotFoundError("Research run not found")
+        run_id = run.id
 
-        already_synthesized = await self._has_step_type(run_id, ResearchStepType.SYNTHESIZER)
+        if existing is None:
+            existing, _ = await self._existing_step_types(run_id)
+
+        already_synthesized = ResearchStepType.SYNTHESIZER in existing
         if already_synthesized:
             raise InvalidPipelineStateError("Synthesis has already been run for this research run.")
 
-        has_reader = await self._has_step_type(run_id, ResearchStepType.READER)
+        has_reader = ResearchStepType.READER in existing
         if not has_reader:
             raise InvalidPipelineStateError("Run reader before synthesis.")
 
-        # Load sources
-        result = await self.db.execute(select(Source).where(Source.run_id == run_id))
-        sources = list(result.scalars().all())
+        sources = list(run.sources)
 
         if not sources:
             answer_text = (
@@ -403,117 +765,206 @@ class PipelineOrchestrator:
                 "Run the searcher agent first to collect relevant sources."
             )
         else:
-            lines: list[str] = []
-            lines.append("This is a dummy synthesized answer based on the attached sources.")
-            lines.append("")
-            lines.append(f"Research question: {run.query}")
-            lines.append("")
-            lines.append("The system considered the following sources:")
-            for idx, src in enumerate(sources, start=1):
-                title = src.title or src.url
-                lines.append(f"{idx}. {title} — {src.url}")
-
-                summ = (src.summary or "").strip()
-                if summ:
-                    lines.append(f"   Summary: {summ}")
-            lines.append("")
-            lines.append(
-                "A proper LLM-backed synthesizer will later read and compare these "
-                "sources in detail to produce a nuanced, citation-rich answer."
+            source_lines = "\n".join(
+                _dummy_source_entry(idx, src) for idx, src in enumerate(sources, start=1)
+            )
+            answer_text = (
+                f"{_DUMMY_ANSWER_PREFIX}"
+                f"Research question: {run.query}\n\n"
+                f"The system considered the following sources:\n"
+                f"{source_lines}\n\n"
+                f"{_DUMMY_ANSWER_SUFFIX}"
             )
-            answer_text = "\n".join(lines)
 
-        next_index = await self._next_step_index(run_id)
+        source_ids = [str(s.id) for s in sources]
 
         now = datetime.now(timezone.utc)
 
-        synth_step = ResearchStep(
+        await self._insert_step(
             run_id=run.id,
-            step_index=next_index,
+            step_index=self._next_step_index_expr(run.id),
             step_type=ResearchStepType.SYNTHESIZER,
             status=ResearchStepStatus.COMPLETED,
             started_at=now,
             completed_at=now,
-            input={"source_ids": [str(s.id) for s in sources]},
+            input={"source_ids": source_ids},
             output={
                 "answer": answer_text,
                 "notes": "Dummy synthesizer v0 – no real LLM call performed.",
                 "source_count": len(sources),
             },
         )
-        self.db.add(synth_step)
+        if existing is not None:
+            existing.add(ResearchStepType.SYNTHESIZER)
 
-        await self._set_status_completed(run)
+        await self._set_status_completed(run, at=now)
 
-        await self.db.commit()
-        await self.db.refresh(run)
+        await self._finish_dummy_step(run, commit=commit)
         return run
-    
-    async def execute_dummy_pipeline(self, run_id: UUID) -> ResearchRun:
-        await self.get_run_detail(run_id)
 
-        if not await self._has_completed_step_type(run_id, ResearchStepType.SEARCHER):
-            await self.run_dummy_search(run_id)
+    async def _advance(self, run_id: UUID, *, commit: bool = True) -> None:
+        """
+        Apply every dummy transition that is still legal
+        (search -> reader -> synthesis) in a single transaction. Stages only
+        flush; the one COMMIT at the end means one WAL flush per advance, and
+        any stage failure rolls back all of them. With commit=False the
+        caller owns that transaction (and the row lock) instead.
+
+        The run row is locked FOR UPDATE so concurrent advances of the same
+        run serialize instead of racing each other's stage checks. The same
+        run object (with its sources loaded) is handed to every stage, so the
+        stages don't re-fetch the run or re-query its sources.
+        """
+        result = await self.db.execute(
+            select(ResearchRun).where(ResearchRun.id == run_id).with_for_update()
+        )
+        run = result.scalars().first()
+        if run is None:
+            raise RunNotFoundError("Research run not found")
 
-        if not await self._has_completed_step_type(run_id, ResearchStepType.READER):
-            await self.run_dummy_reader(run_id)
+        if run.status == ResearchRunStatus.COMPLETED:
+            # Nothing left to apply. Release the lock with a plain commit:
+            # no writes happened, so there is no cache to bump or event to send.
+            if commit:
+                await self.db.commit()
+            return
+
+        # Fetch the stage gates once; each stage updates `existing` as it
+        # adds its step, so no further existence probes are needed.
+        existing, completed = await self._existing_step_types(run_id)
+
+        if ResearchStepType.SEARCHER in existing:
+            # The dummy stages only read these columns; leave raw_content and
+            # extra_metadata in the database (get_run_detail fills them in).
+            sources_result = await self.db.execute(
+                select(Source)
+                .options(*_DUMMY_STAGE_SOURCE_OPTIONS)
+                .where(Source.run_id == run_id)
+            )
+            set_committed_value(run, "sources", list(sources_result.scalars()))
+        else:
+            # Sources are only ever written alongside a searcher step, so a
+            # run that hasn't been searched has none: skip the query.
+            set_committed_value(run, "sources", [])
+
+        try:
+            if ResearchStepType.SEARCHER not in completed:
+                await self.run_dummy_search(run, commit=False, existing=existing)
 
-        if not await self._has_completed_step_type(run_id, ResearchStepType.SYNTHESIZER):
-            await self.run_dummy_synthesis(run_id)
+            if ResearchStepType.READER not in completed:
+                await self.run_dummy_reader(run, commit=False, existing=existing)
 
+            if ResearchStepType.SYNTHESIZER not in completed:
+                await self.run_dummy_synthesis(run, commit=False, existing=existing)
+        except Exception:
+            await self.db.rollback()
+            raise
+
+        if commit:
+            await self._commit(run_id)
+        else:
+            await self.db.flush()
+
+    async def advance_pipeline(self, run_id: UUID) -> ResearchRun:
+        """_advance, then load the detail the endpoints respond with."""
+        await self._advance(run_id)
         return await self.get_run_detail(run_id)
+
+    async def execute_dummy_pipeline(self, run_id: UUID) -> ResearchRun:
+        return await self.advance_pipeline(run_id)
     
     async def execute_pipeline(self, run_id: UUID) -> ResearchRun:
-        await self.get_run_detail(run_id)
+        """_run_real_pipeline, then load the resulting run detail."""
+        await self._run_real_pipeline(run_id)
+        return await self.get_run_detail(run_id)
+
+    async def _run_real_pipeline(self, run_id: UUID) -> None:
+        """
+        Real pipeline: web search -> web reader -> LLM synthesis.
+
+        Unlike advance_pipeline, each stage commits on its own. The stages
+        wait on the network and the LLM for seconds at a time, and a single
+        wrapping transaction would hold a pooled connection (and row locks)
+        across all of it; per-stage commits also let SSE subscribers see
+        progress as each stage lands.
+        """
+        # Existence check only. Session.get answers from the identity map when execute() has
+        # already loaded the run, so that path costs no query at all.
+        if await self.db.get(ResearchRun, run_id) is None:
+            raise RunNotFoundError("Research run not found")
 
-        if not await self._has_completed_step_type(run_id, ResearchStepType.SEARCHER):
+        # One query for all three gates. A stage only ever completes its own
+        # step type, so the set can't go stale for the later checks.
+        _, completed = await self._existing_step_types(run_id)
+
+        if ResearchStepType.SEARCHER not in completed:
             await self.run_web_search(run_id, limit=5)
 
-        if not await self._has_completed_step_type(run_id, ResearchStepType.READER):
+        if ResearchStepType.READER not in completed:
             await self.run_web_reader(run_id, limit=5)
 
-        if not await self._has_completed_step_type(run_id, ResearchStepType.SYNTHESIZER):
+        if ResearchStepType.SYNTHESIZER not in completed:
             await self.run_llm_synthesis(run_id)
-
-        return await self.get_run_detail(run_id)
     
-    async def run_dummy_reader(self, run_id: UUID) -> ResearchRun:
-        run = await self.db.get(ResearchRun, run_id)
-        if run is None:
-            raise RunNotFoundError("Research run not found")
+    async def run_dummy_reader(
+        self,
+        run: ResearchRun,
+        *,
+        commit: bool = True,
+        existing: set[ResearchStepType] | None = None,
+    ) -> ResearchRun:
+        """
+        Orchestrated dummy reader: fills in content and summaries for every
+        source in `run.sources` (which must be loaded, as for synthesis).
+        """
+        run_id = run.id
+
+        if existing is None:
+            existing, _ = await self._existing_step_types(run_id)
 
-        already_read = await self._has_step_type(run_id, ResearchStepType.READER)
+        already_read = ResearchStepType.READER in existing
         if already_read:
             raise InvalidPipelineStateError("Reader has already been run for this research run.")
 
-        has_search = await self._has_step_type(run_id, ResearchStepType.SEARCHER)
+        has_search = ResearchStepType.SEARCHER in existing
         if not has_search:
             raise InvalidPipelineStateError("Run search before reader.")
 
-        result = await self.db.execute(select(Source).where(Source.run_id == run_id))
-        sources = list(result.scalars().all())
+        sources = list(run.sources)
 
         if not sources:
             raise InvalidPipelineStateError("No sources available to read.")
 
         now = datetime.now(timezone.utc)
 
-        for src in sources:
-            src.raw_content = (
-                f"This is dummy fetched content for source: {src.title or src.url}. "
-                f"It simulates the full text content retrieved from the web."
-            )
+        updates = [
+            {
+                "id": src.id,
+                "raw_content": (
+                    f"This is dummy fetched content for source: {src.title or src.url}. "
+                    f"It simulates the full text content retrieved from the web."
+                ),
+                "summary": (
+                    f"Summary for {src.title or src.url}. "
+                    f"This represents a condensed version of the source content."
+                ),
+            }
+            for src in sources
+        ]
 
-            src.summary = (
-                f"Summary for {src.title or src.url}. "
-                f"This represents a condensed version of the source content."
-            )
+        # Bulk UPDATE by primary key: one executemany batch instead of one
+        # UPDATE per dirty Source at flush time.
+        await self.db.execute(update(Source), updates)
 
-        next_index = await self._next_step_index(run_id)
+        # The bulk path bypasses the identity map, so mirror the new values
+        # onto the loaded objects without marking them dirty again.
+        for src, values in zip(sources, updates):
+            set_committed_value(src, "raw_content", values["raw_content"])
+            set_committed_value(src, "summary", values["summary"])
 
-        reader_step = ResearchStep(
+        await self._insert_step(
             run_id=run.id,
-            step_index=next_index,
+            step_index=self._next_step_index_expr(run.id),
             step_type=ResearchStepType.READER,
             status=ResearchStepStatus.COMPLETED,
             started_at=now,
@@ -521,27 +972,25 @@ class PipelineOrchestrator:
             input={"source_ids": [str(s.id) for s in sources]},
             output={"source_count": len(sources)},
         )
+        if existing is not None:
+            existing.add(ResearchStepType.READER)
 
-        self.db.add(reader_step)
-
-        await self.db.commit()
-        await self.db.refresh(run)
+        await self._finish_dummy_step(run, commit=commit)
         return run
     
     async def run_web_search(self, run_id: UUID, limit: int = 5) -> ResearchRun:
-        run = await self.db.get(ResearchRun, run_id)
-        if run is None:
-            raise RunNotFoundError("Research run not found")
+        run = await self._load_run_with_steps(run_id)
+        existing = {step.step_type for step in run.steps}
 
-        already_searched = await self._has_step_type(run_id, ResearchStepType.SEARCHER)
+        already_searched = ResearchStepType.SEARCHER in existing
         if already_searched:
             raise InvalidPipelineStateError("Search has already been run for this research run.")
 
-        has_planner = await self._has_step_type(run_id, ResearchStepType.PLANNER)
+        has_planner = ResearchStepType.PLANNER in existing
         if not has_planner:
             raise InvalidPipelineStateError("Planner step missing; cannot run search.")
 
-        client = DuckDuckGoClient()
+        client = get_search_client()
 
         search_query_used = run.query
         results = await client.search(search_query_used, limit=limit)
@@ -560,9 +1009,9 @@ class PipelineOrchestrator:
             )
         
         now = datetime.now(timezone.utc)
-        next_index = await self._next_step_index(run_id)
+        next_index = _next_step_index_from_loaded(run)
 
-        step = ResearchStep(
+        await self._insert_step(
             run_id=run.id,
             step_index=next_index,
             step_type=ResearchStepType.SEARCHER,
@@ -576,55 +1025,66 @@ class PipelineOrchestrator:
             },
             output={"result_count": len(results), "provider": "duckduckgo_html"},
         )
-        self.db.add(step)
 
-        sources = [
-            Source(
-                run_id=run.id,
-                url=r.url,
-                title=r.title,
-                raw_content=None,
-                summary=None,
-                relevance_score=None,
-                extra_metadata={"provider": "duckduckgo_html"},
-            )
-            for r in results
-        ]
-        self.db.add_all(sources)
+        # One executemany batch for all results; nothing here reads the
+        # Source objects back, so skip the unit of work entirely.
+        await self.db.execute(
+            insert(Source),
+            [
+                {
+                    "run_id": run.id,
+                    "url": r.url,
+                    "title": r.title,
+                    "raw_content": None,
+                    "summary": None,
+                    "relevance_score": None,
+                    "extra_metadata": _WEB_SOURCE_METADATA,
+                }
+                for r in results
+            ],
+        )
 
-        await self._set_status_running_if_pending(run)
+        await self._set_status_running_if_pending(run, at=now)
 
-        await self.db.commit()
-        await self.db.refresh(run)
+        await self._commit(run_id)
         return run
     
     async def run_web_reader(self, run_id: UUID, limit: int = 5) -> ResearchRun:
-        run = await self.db.get(ResearchRun, run_id)
-        if run is None:
-            raise RunNotFoundError("Research run not found")
+        run = await self._load_run_with_steps(run_id)
+        existing = {step.step_type for step in run.steps}
 
-        has_search = await self._has_step_type(run_id, ResearchStepType.SEARCHER)
+        has_search = ResearchStepType.SEARCHER in existing
         if not has_search:
             raise InvalidPipelineStateError("Run search before reader.")
 
-        already_read = await self._has_step_type(run_id, ResearchStepType.READER)
+        already_read = ResearchStepType.READER in existing
         if already_read:
             raise InvalidPipelineStateError("Reader has already been run for this research run.")
 
-        # Load sources for this run
-        result = await self.db.execute(select(Source).where(Source.run_id == run_id))
-        sources = list(result.scalars().all())
+        # Read only sources that don't have raw_content yet, fetching just the
+        # columns the reader uses rather than every source's stored content.
+        result = await self.db.execute(
+            select(Source)
+            .options(*_READER_SOURCE_OPTIONS)
+            .where(
+                Source.run_id == run_id,
+                or_(Source.raw_content.is_(None), Source.raw_content == ""),
+            )
+            .limit(limit)
+        )
+        to_read = list(result.scalars())
 
-        if not sources:
-            raise InvalidPipelineStateError(
-                "No sources found to read. Search returned no usable results."
+        if not to_read:
+            has_sources = await self.db.scalar(
+                select(exists().where(Source.run_id == run_id))
             )
-        
-        # Read only sources that don't have raw_content yet
-        to_read = [s for s in sources if not s.raw_content][:limit]
+            if not has_sources:
+                raise InvalidPipelineStateError(
+                    "No sources found to read. Search returned no usable results."
+                )
 
         now = datetime.now(timezone.utc)
-        next_index = await self._next_step_index(run_id)
+        next_index = _next_step_index_from_loaded(run)
 
         read_count = 0
         usable_count = 0
@@ -641,7 +1101,7 @@ class PipelineOrchestrator:
                 step_type=ResearchStepType.READER,
                 status=ResearchStepStatus.COMPLETED,
                 started_at=now,
-                completed_at=datetime.now(timezone.utc),
+                completed_at=now,
                 input={"limit": limit},
                 output={
                     "attempted": 0,
@@ -653,53 +1113,67 @@ class PipelineOrchestrator:
                 },
             )
             self.db.add(step)
-            await self.db.commit()
-            await self.db.refresh(run)
+            await self._commit(run_id)
             return run
 
         # --- concurrent read with bounded parallelism ---
-        import asyncio  # local import to keep file minimal
-
         semaphore = asyncio.Semaphore(4)  # keep it small; avoids hammering sites
 
+        updates: list[dict[str, Any]] = []
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _READER_BUDGET_S
+
+        async def fetch_and_parse(src: Source, client: httpx.AsyncClient) -> tuple[str, str]:
+            page = await fetch_html(src.url, client=client)
+
+            # Parsing is CPU-bound; run it off the event loop so the
+            # other fetches keep making progress meanwhile.
+            text = await asyncio.to_thread(extract_text_from_html, page.body)
+            return text, basic_summary(text, max_chars=900)
+
         async def read_one(src: Source, client: httpx.AsyncClient) -> None:
             nonlocal read_count, usable_count
 
             async with semaphore:
+                # Time spent queued on the semaphore counts against the batch
+                # budget but not the page timeout.
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    failed.append({"url": src.url, "error": "Reader time budget exhausted"})
+                    return
+
+                timeout_s = min(_READER_PAGE_TIMEOUT_S, remaining)
                 try:
-                    page = await fetch_html(src.url, client=client)
-                    
-                    def extract_text_from_html(html: str) -> str:
-                        soup = BeautifulSoup(html, "lxml")
-
-                        # Remove junk
-                        for tag in soup(["script", "style", "noscript", "header", "footer", "nav", "aside"]):
-                            tag.decompose()
-
-                        text = soup.get_text(separator=" ", strip=True)
-
-                        return text
-                    text = extract_text_from_html(page.html)
+                    text, summary = await asyncio.wait_for(
+                        fetch_and_parse(src, client),
+                        timeout=timeout_s,
+                    )
 
                     # Keep raw_content bounded so DB doesn't explode
                     cleaned = (text or "").strip()
                     if not cleaned:
                         raise ValueError("Empty extracted text")
 
-                    src.raw_content = text[:20_000]
-
-                    summary = basic_summary(text, max_chars=900)
+                    raw_content = text[:20_000]
 
                     if not summary or len(summary.strip()) < 50:
                         summary = f"{src.title or src.url} - content could not be fully extracted."
 
-                    src.summary = summary
-
-                    src.relevance_score = self._score_source_relevance(
-                        query=run.query,
-                        title=src.title,
-                        summary=src.summary,
-                        raw_content=src.raw_content,
+                    # Collected rather than set on `src`, so the writes go out
+                    # as one bulk UPDATE after all fetches finish.
+                    updates.append(
+                        {
+                            "id": src.id,
+                            "raw_content": raw_content,
+                            "summary": summary,
+                            "relevance_score": self._score_source_relevance(
+                                query=run.query,
+                                title=src.title,
+                                summary=summary,
+                                raw_content=raw_content,
+                            ),
+                        }
                     )
 
                     read_count += 1
@@ -707,19 +1181,28 @@ class PipelineOrchestrator:
                     if len(summary.strip()) > 50:
                         usable_count += 1
 
+                except asyncio.TimeoutError:
+                    failed.append({"url": src.url, "error": f"Timed out after {timeout_s:.1f}s"})
                 except (UnsafeUrlError, httpx.HTTPError, ValueError) as exc:
                     failed.append({"url": src.url, "error": str(exc)})
                 except Exception as exc:  # noqa: BLE001
                     failed.append({"url": src.url, "error": f"Unexpected error: {exc}"})
 
-        headers = {"User-Agent": "InquiryOS/0.1 (+https://localhost)"}  # safe default
+        client = get_reader_client()
+        await asyncio.gather(*(read_one(s, client) for s in to_read))
+
+        if updates:
+            # Bulk UPDATE by primary key: one executemany batch instead of one
+            # UPDATE per dirty Source at flush time.
+            await self.db.execute(update(Source), updates)
 
-        async with httpx.AsyncClient(
-            timeout=10.0,
-            follow_redirects=True,
-            headers=headers,
-        ) as client:
-            await asyncio.gather(*(read_one(s, client) for s in to_read))
+            # Mirror the new values onto the loaded sources, as the dummy
+            # reader does, without marking them dirty again.
+            by_id = {src.id: src for src in to_read}
+            for values in updates:
+                src = by_id[values["id"]]
+                for key in ("raw_content", "summary", "relevance_score"):
+                    set_committed_value(src, key, values[key])
 
         # Mark step status: completed even if partial, but record failures
         step = ResearchStep(
@@ -739,17 +1222,40 @@ class PipelineOrchestrator:
         )
         self.db.add(step)
 
-        await self.db.commit()
-        await self.db.refresh(run)
+        await self._commit(run_id)
         return run
     
     async def get_run_state(self, run_id: UUID) -> dict:
-        run = await self.get_run_detail(run_id)
+        # Both source counts ride along as correlated subqueries (index scans
+        # on ix_sources_run_id), so /state is a single round trip and never
+        # ships source rows to Python.
+        stmt = lambda_stmt(
+            lambda: select(
+                ResearchRun,
+                select(func.count())
+                .where(Source.run_id == ResearchRun.id)
+                .scalar_subquery(),
+                select(func.count())
+                .where(
+                    Source.run_id == ResearchRun.id,
+                    func.btrim(Source.summary, _WHITESPACE) != "",
+                )
+                .scalar_subquery(),
+            )
+            .options(*_STATE_LOAD_OPTIONS)
+            .where(ResearchRun.id == run_id)
+        )
+
+        result = await self.db.execute(stmt)
+        row = result.unique().first()
+        if row is None:
+            raise RunNotFoundError("Research run not found")
+        run, source_count, sources_with_summary = row
 
-        # Map latest step per type
-        latest_by_type: dict[ResearchStepType, ResearchStep] = {}
-        for step in sorted(run.steps, key=lambda s: s.step_index):
-            latest_by_type[step.step_type] = step
+        # Map latest step per type. run.steps is already ordered by
+        # step_index (relationship order_by), and uq_research_steps_run_type
+        # allows one step per type anyway, so no re-sort is needed.
+        latest_by_type = {step.step_type: step for step in run.steps}
 
         steps: dict[ResearchStepType, dict] = {}
         for t in ResearchStepType:
@@ -769,22 +1275,29 @@ class PipelineOrchestrator:
                     "error_message": s.error_message,
                 }
 
-        sources_with_summary = sum(1 for src in run.sources if (src.summary or "").strip())
-
         return {
             "run_id": run.id,
             "status": run.status,
             "steps": steps,
-            "source_count": len(run.sources),
+            "source_count": source_count,
             "sources_with_summary": sources_with_summary,
         }
     
-    async def execute(self, run_id: UUID, mode: ExecutionMode) -> ResearchRun:
+    async def execute(self, run_id: UUID, mode: ExecutionMode) -> None:
+        """
+        Run the pipeline in `mode`, recording STARTED and COMPLETED/FAILED
+        events.
+
+        Returns nothing: the only caller is the background task, so this calls
+        the stage runners directly rather than the public wrappers, which
+        would each load the full run detail just for it to be discarded.
+        """
         run = await self.db.get(ResearchRun, run_id)
         if run is None:
             raise RunNotFoundError("Research run not found")
 
-        started_at = datetime.now(timezone.utc)
+        # Monotonic, so wall-clock adjustments can't skew event durations.
+        started_ns = time.perf_counter_ns()
 
         db_mode = DbExecutionMode.DUMMY if mode == ExecutionMode.DUMMY else DbExecutionMode.REAL
 
@@ -796,19 +1309,23 @@ class PipelineOrchestrator:
             error_message=None,
         )
         self.db.add(started_event)
-        await self.db.commit()
+        if mode != ExecutionMode.DUMMY:
+            # The real pipeline runs for seconds; make STARTED visible now.
+            # The dummy pipeline finishes in milliseconds, so STARTED, its
+            # stages and COMPLETED all go out in the one commit below.
+            await self._commit(run_id, event=started_event)
 
         stage: str | None = None
 
         try:
             if mode == ExecutionMode.DUMMY:
                 stage = "execute_dummy_pipeline"
-                await self.execute_dummy_pipeline(run_id)
+                await self._advance(run_id, commit=False)
             else:
                 stage = "execute_pipeline"
-                await self.execute_pipeline(run_id)
+                await self._run_real_pipeline(run_id)
 
-            duration_ms = int((datetime.now(timezone.utc) - started_at).total_seconds() * 1000)
+            duration_ms = (time.perf_counter_ns() - started_ns) // 1_000_000
 
             completed_event = PipelineEvent(
                 run_id=run.id,
@@ -818,14 +1335,22 @@ class PipelineOrchestrator:
                 duration_ms=duration_ms,
                 error_message=None,
             )
+            # Committed inline, not via a write-behind queue: /detail reads
+            # events from this table, and _commit's cache bump and SSE
+            # publish must not run ahead of the row being visible.
             self.db.add(completed_event)
-            await self.db.commit()
+            await self._commit(run_id, event=completed_event)
 
         except Exception as exc:  # noqa: BLE001
             # If the pipeline code threw after making DB changes, ensure session is usable
             await self.db.rollback()
 
-            duration_ms = int((datetime.now(timezone.utc) - started_at).total_seconds() * 1000)
+            # An uncommitted STARTED event was discarded by the rollback;
+            # write it with the failure instead.
+            if inspect(started_event).transient:
+                self.db.add(started_event)
+
+            duration_ms = (time.perf_counter_ns() - started_ns) // 1_000_000
 
             # Mark run failed (best-effort)
             run = await self.db.get(ResearchRun, run_id)
@@ -842,27 +1367,38 @@ class PipelineOrchestrator:
                 error_message=str(exc),
             )
             self.db.add(failed_event)
-            await self.db.commit()
+            await self._commit(run_id, event=failed_event)
 
             raise
-
-        return await self.get_run_detail(run_id)
     
     async def run_llm_synthesis(self, run_id: UUID) -> ResearchRun:
-        run = await self.db.get(ResearchRun, run_id)
-        if run is None:
-            raise RunNotFoundError("Research run not found")
+        run = await self._load_run_with_steps(run_id)
+        existing = {step.step_type for step in run.steps}
 
-        already_synthesized = await self._has_step_type(run_id, ResearchStepType.SYNTHESIZER)
+        already_synthesized = ResearchStepType.SYNTHESIZER in existing
         if already_synthesized:
             raise InvalidPipelineStateError("Synthesis has already been run for this research run.")
 
-        has_reader = await self._has_step_type(run_id, ResearchStepType.READER)
+        has_reader = ResearchStepType.READER in existing
         if not has_reader:
             raise InvalidPipelineStateError("Run reader before synthesis.")
 
-        result = await self.db.execute(select(Source).where(Source.run_id == run_id))
-        all_sources = list(result.scalars().all())
+        # One extra character past the evidence limit, so _compact can still
+        # tell a truncated page from one that fit.
+        sources_result = await self.db.execute(
+            select(
+                Source,
+                func.left(
+                    func.btrim(Source.raw_content, _WHITESPACE),
+                    _SYNTHESIS_EVIDENCE_CHARS + 1,
+                ),
+            )
+            .options(*_SYNTHESIS_SOURCE_OPTIONS)
+            .where(Source.run_id == run_id)
+        )
+        source_rows = sources_result.all()
+        all_sources = [src for src, _ in source_rows]
+        raw_evidence = {src.id: raw for src, raw in source_rows}
 
         if not all_sources:
             raise InvalidPipelineStateError("No sources available for synthesis.")
@@ -873,120 +1409,59 @@ class PipelineOrchestrator:
         )
 
         now = datetime.now(timezone.utc)
-        next_index = await self._next_step_index(run_id)
+        next_index = _next_step_index_from_loaded(run)
 
         try:
-            def _compact(text: str, max_chars: int) -> str:
-                t = (text or "").strip()
-                if len(t) <= max_chars:
-                    return t
-                return t[: max_chars - 20].rstrip() + " ...[truncated]"
-
-            context_lines: list[str] = []
-            for idx, src in enumerate(sources, start=1):
+            def _context_block(idx: int, src: Source) -> str:
                 title = (src.title or src.url).strip()
                 summary = (src.summary or "").strip()
-                raw = (src.raw_content or "").strip()
+                raw = raw_evidence[src.id] or ""  # trimmed in SQL
 
                 evidence_text = raw if raw else summary
                 if not evidence_text:
                     evidence_text = "(No content available for this source.)"
 
-                evidence_compact = _compact(evidence_text, 1800)
+                evidence_compact = _compact(evidence_text, _SYNTHESIS_EVIDENCE_CHARS)
 
-                context_lines.append(
-                    "\n".join(
-                        [
-                            f"[{idx}] {title}",
-                            f"URL: {src.url}",
-                            f"EVIDENCE (use for citations): {evidence_compact}",
-                        ]
-                    )
+                return (
+                    f"[{idx}] {title}\n"
+                    f"URL: {src.url}\n"
+                    f"EVIDENCE (use for citations): {evidence_compact}"
                 )
 
-            context = "\n\n".join(context_lines)
+            context = "\n\n".join(
+                _context_block(idx, src) for idx, src in enumerate(sources, start=1)
+            )
             context = _compact(context, 14_000)
 
-            prompt = f"""You are an expert research assistant helping someone make a real decision.
-
-GOAL:
-Produce a high-quality, practical answer using the provided evidence sources.
-
-REQUIREMENTS:
-
-1. Use MULTIPLE sources where possible (not just one).
-2. Every key point and every risk MUST include citations like [1], [2], etc.
-3. Do not repeat the same source for everything — aim for coverage across sources.
-4. Be specific and concrete. Avoid vague or generic statements.
-
-OUTPUT FORMAT (follow EXACTLY):
-
-SUMMARY:
-A concise but clear answer to the question.
-
-KEY POINTS:
-- A meaningful point supported by evidence [n]
-- Another point supported by evidence [n]
-
-RISKS:
-- A real downside or uncertainty [n]
-- Another risk [n]
-
-RECOMMENDATION:
-Give a clear, well-written, and actionable recommendation.
-
-Structure:
-- Write in 2–4 complete sentences.
-- Use proper punctuation and sentence breaks.
-- Do NOT use bullet points or dashes.
-- Each sentence should express one clear idea.
-
-Content:
-- Include 1–2 concrete actions the user should take next
-- Include a condition under which they SHOULD quit
-- Include a condition under which they should NOT quit
-
-Rules:
-- Write natural, readable English (like a human advisor)
-- Do NOT include the word "CONFIDENCE"
-- Do NOT include any numeric score
-- Do NOT include labels or formatting artifacts
-
-CONFIDENCE:
-Write exactly one number between 0.0 and 1.0 on the next line.
-Example:
-CONFIDENCE:
-0.72
-
----
-
-GUIDELINES:
-- Prefer using multiple high-relevance sources from the provided set
-- If sources disagree, mention that
-- If evidence is weak, reflect that in the confidence score
-- Do NOT invent facts — only use provided summaries
-- Avoid using hyphens or bullet-style formatting inside paragraphs.
----
-
-Research question:
-{run.query}
-
-Sources:
-{context}
-"""
+            prompt = (
+                f"{_SYNTHESIS_PROMPT_PREFIX}"
+                f"Research question:\n{run.query}\n\n"
+                f"Sources:\n{context}\n"
+            )
 
             try:
                 llm: LLMClient = get_llm_client()
             except Exception as exc:  # noqa: BLE001
                 raise InvalidPipelineStateError(f"LLM client unavailable: {exc}")
 
-            raw_completion = await llm.generate(
+            # Stream so SSE subscribers see progress while the model is still
+            # generating; the chunks are joined once at the end.
+            chunks: list[str] = []
+            async for chunk in llm.stream(
                 prompt=prompt,
                 options={
                     "max_tokens": 900,
                     "temperature": 0.1,
                 },
-            )
+            ):
+                chunks.append(chunk)
+                if len(chunks) % _SYNTHESIS_PROGRESS_EVERY == 0:
+                    pipeline_event_broker.publish(
+                        run_id,
+                        {"type": "synthesis_progress", "chunks": len(chunks)},
+                    )
+            raw_completion = "".join(chunks)
 
             parsed: dict
             parse_error: str | None = None
@@ -1016,23 +1491,32 @@ Sources:
                 }
                 parse_error = f"{parse_error or ''} | schema_error={exc}".strip(" |")
 
-            citation_pattern = re.compile(r"\[\d+\]")
-
-            def _has_citation(text: str) -> bool:
-                return bool(citation_pattern.search(text))
-
             key_points = output_payload.get("key_points", [])
             risks = output_payload.get("risks", [])
 
+            source_count = len(sources)
+            cited_indices: set[int] = set()
             missing_citations: list[str] = []
 
-            for idx, point in enumerate(key_points):
-                if isinstance(point, str) and not _has_citation(point):
-                    missing_citations.append(f"key_points[{idx}]")
-
-            for idx, risk in enumerate(risks):
-                if isinstance(risk, str) and not _has_citation(risk):
-                    missing_citations.append(f"risks[{idx}]")
+            # One scan per string answers both "is anything cited?" and
+            # "which sources?".
+            for field, items in (("key_points", key_points), ("risks", risks)):
+                count_cited = isinstance(items, list)
+                for idx, text in enumerate(items):
+                    if not isinstance(text, str):
+                        continue
+                    numbers = _CITATION_RE.findall(text)
+                    if not numbers:
+                        missing_citations.append(f"{field}[{idx}]")
+                    if not count_cited:
+                        continue
+                    for m in numbers:
+                        try:
+                            n = int(m)
+                        except ValueError:
+                            continue
+                        if 1 <= n <= source_count:
+                            cited_indices.add(n)
 
             if missing_citations:
                 output_payload["confidence"] = min(output_payload.get("confidence", 0.5), 0.3)
@@ -1040,26 +1524,6 @@ Sources:
                     {"type": "missing_citations", "fields": missing_citations}
                 )
 
-            source_count = len(sources)
-            cited_indices: set[int] = set()
-
-            combined_texts = []
-            if isinstance(key_points, list):
-                combined_texts.extend(key_points)
-            if isinstance(risks, list):
-                combined_texts.extend(risks)
-
-            for text in combined_texts:
-                if not isinstance(text, str):
-                    continue
-                for m in re.findall(r"\[(\d+)\]", text):
-                    try:
-                        n = int(m)
-                    except ValueError:
-                        continue
-                    if 1 <= n <= source_count:
-                        cited_indices.add(n)
-
             coverage_ratio = (len(cited_indices) / source_count) if source_count > 0 else 0.0
 
             output_payload.setdefault("_meta", {})
@@ -1079,7 +1543,9 @@ Sources:
             )
             existing_answer = result.scalar_one_or_none()
 
-            content_text = json.dumps(output_payload)
+            # orjson, like the engine's JSONB codec; the answer content is
+            # the same payload as the step output.
+            content_text = orjson.dumps(output_payload).decode("utf-8")
 
             if existing_answer:
                 existing_answer.content = content_text
@@ -1092,13 +1558,14 @@ Sources:
                 )
                 self.db.add(new_answer)
 
+            completed_at = datetime.now(timezone.utc)
             synth_step = ResearchStep(
                 run_id=run.id,
                 step_index=next_index,
                 step_type=ResearchStepType.SYNTHESIZER,
                 status=ResearchStepStatus.COMPLETED,
                 started_at=now,
-                completed_at=datetime.now(timezone.utc),
+                completed_at=completed_at,
                 error_message=None,
                 input={
                     "source_ids": [str(s.id) for s in sources],
@@ -1119,9 +1586,8 @@ Sources:
             )
             self.db.add(synth_step)
 
-            await self._set_status_completed(run)
-            await self.db.commit()
-            await self.db.refresh(run)
+            await self._set_status_completed(run, at=completed_at)
+            await self._commit(run_id)
             return run
 
         except Exception as exc:  # noqa: BLE001
@@ -1154,5 +1620,5 @@ Sources:
                 },
             )
             self.db.add(failed_step)
-            await self.db.commit()
+            await self._commit(run_id)
             raise
\ No newline at end of file
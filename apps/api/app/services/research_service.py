@@ -3,7 +3,7 @@ from typing import Any
 from uuid import UUID
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
@@ -169,12 +169,11 @@ async def _next_step_index_for_run(
     If there are no steps yet, this returns 0.
     """
     result = await db.execute(
-        select(ResearchStep.step_index).where(ResearchStep.run_id == run_id)
+        select(func.coalesce(func.max(ResearchStep.step_index) + 1, 0)).where(
+            ResearchStep.run_id == run_id
+        )
     )
-    indices = list(result.scalars().all())
-    if not indices:
-        return 0
-    return max(indices) + 1
+    return result.scalar_one()
 
 
 async def create_research_run_with_basic_plan(
@@ -197,17 +196,6 @@ async def create_research_run_with_basic_plan(
     if not title or not str(title).strip():
         title = await _generate_title_with_llm(query)
 
-    run = ResearchRun(
-        query=query,
-        title=title,
-        status=ResearchRunStatus.PENDING,
-        model_provider=f"{settings.llm_provider}:{settings.llm_model}",
-    )
-
-    db.add(run)
-    # flush so run.id is populated before we create the step
-    await db.flush()
-
     # Try to get an LLM client; fall back to no LLM if provider is unsupported
     llm: LLMClient | None
     try:
@@ -215,24 +203,36 @@ async def create_research_run_with_basic_plan(
     except Exception:  # noqa: BLE001
         llm = None
 
+    # Do the (slow) planning before touching the DB so no transaction is held
+    # open across the LLM call.
     plan_output = await _generate_planner_output(query, llm)
 
     now = datetime.now(timezone.utc)
 
-    step = ResearchStep(
-        run_id=run.id,
-        step_index=0,
-        step_type=ResearchStepType.PLANNER,
-        status=ResearchStepStatus.COMPLETED,
-        started_at=now,
-        completed_at=now,
-        input={"query": query},
-        output=plan_output,
+    run = ResearchRun(
+        query=query,
+        title=title,
+        status=ResearchRunStatus.PENDING,
+        model_provider=settings.llm_model_provider,
+        error_message=None,
+        steps=[
+            ResearchStep(
+                step_index=0,
+                step_type=ResearchStepType.PLANNER,
+                status=ResearchStepStatus.COMPLETED,
+                started_at=now,
+                completed_at=now,
+                input={"query": query},
+                output=plan_output,
+            ),
+        ],
     )
 
-    db.add(step)
+    # Run + planner step go out in a single flush on commit. Every column the
+    # API returns is already populated in memory (client-side defaults, and
+    # expire_on_commit=False), so no refresh round trip is needed.
+    db.add(run)
     await db.commit()
-    await db.refresh(run)
 
     return run
 
@@ -305,8 +305,9 @@ async def run_dummy_search_for_run(
     ]
 
     db.add_all(sources)
+    # expire_on_commit is off and the run itself wasn't modified, so there
+    # is nothing to reload.
     await db.commit()
-    await db.refresh(run)
 
     return run
 
@@ -376,7 +377,8 @@ async def run_dummy_synthesis_for_run(
     )
 
     db.add(synth_step)
+    # expire_on_commit is off and the run itself wasn't modified, so there
+    # is nothing to reload.
     await db.commit()
-    await db.refresh(run)
 
     return run
\ No newline at end of file
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import itertools
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.db.models import ResearchRunStatus
+
+_TERMINAL_TTL_S = 24 * 60 * 60
+_ACTIVE_TTL_S = 2.0
+
+# LRU bounds: runs with cached bodies (a few views each), and runs whose
+# version is tracked (just an int each, so many more).
+_MAX_CACHED_RUNS = 1_000
+_MAX_TRACKED_VERSIONS = 50_000
+
+_TERMINAL_STATUSES = frozenset(
+    {ResearchRunStatus.COMPLETED, ResearchRunStatus.FAILED}
+)
+
+# Makes ETags from a previous process never match the current one,
+# since versions restart on boot.
+_BOOT_ID = uuid.uuid4().hex[:8]
+
+
+# Cache-Control for run payloads. Even completed runs can change (/execute
+# may run them again, adding events), so clients always revalidate; the ETag
+# makes that a cheap 304. private: per-run data has no business in shared
+# proxy caches.
+RUN_CACHE_CONTROL = "private, no-cache"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    status: ResearchRunStatus
+    expires_at: float
+
+
+# (run_id, version, view)
+CacheKey = tuple[UUID, int, str]
+
+
+class RunResponseCache:
+    """
+    In-process cache of serialized run responses, keyed by a per-run version.
+
+    Every write path bumps the run's version, which both invalidates cached
+    bodies and changes the ETag. Terminal runs are cached for a day; pending
+    and running runs only for a couple of seconds, which is enough to absorb
+    UI polling bursts without serving noticeably stale state.
+
+    Both the cached bodies and the version table are LRU-bounded. Versions
+    come from one process-wide counter, so a run whose version was evicted
+    gets a fresh, never-used number on its next access rather than falling
+    back to one an old ETag could still match.
+
+    Versions live in this process, so this assumes pipeline writes happen in
+    the same process as the reads (true for the background-task executor).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_runs: int = _MAX_CACHED_RUNS,
+        max_versions: int = _MAX_TRACKED_VERSIONS,
+    ) -> None:
+        self._max_runs = max_runs
+        self._max_versions = max_versions
+        self._counter = itertools.count(1)
+        self._versions: OrderedDict[UUID, int] = OrderedDict()
+        # Entries grouped per run, so bump() drops one run's bodies directly.
+        self._entries: OrderedDict[UUID, dict[tuple[int, str], CachedResponse]] = OrderedDict()
+
+    def version(self, run_id: UUID) -> int:
+        version = self._versions.get(run_id)
+        if version is None:
+            return self._assign_version(run_id)
+        self._versions.move_to_end(run_id)
+        return version
+
+    def _assign_version(self, run_id: UUID) -> int:
+        version = next(self._counter)
+        self._versions[run_id] = version
+        self._versions.move_to_end(run_id)
+        if len(self._versions) > self._max_versions:
+            evicted, _ = self._versions.popitem(last=False)
+            # Its bodies were cached under a version nothing will ask for again.
+            self._entries.pop(evicted, None)
+        return version
+
+    def etag(self, run_id: UUID) -> str:
+        return f'W/"{_BOOT_ID}-{self.version(run_id)}"'
+
+    def key(self, run_id: UUID, view: str) -> CacheKey:
+        return (run_id, self.version(run_id), view)
+
+    def bump(self, run_id: UUID) -> None:
+        self._assign_version(run_id)
+        self._entries.pop(run_id, None)
+
+    def get(self, key: CacheKey) -> CachedResponse | None:
+        run_id, version, view = key
+        views = self._entries.get(run_id)
+        if views is None:
+            return None
+        entry = views.get((version, view))
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del views[(version, view)]
+            if not views:
+                del self._entries[run_id]
+            return None
+        self._entries.move_to_end(run_id)
+        return entry
+
+    def set(self, key: CacheKey, body: bytes, status: ResearchRunStatus) -> None:
+        run_id, version, view = key
+        ttl_s = _TERMINAL_TTL_S if status in _TERMINAL_STATUSES else _ACTIVE_TTL_S
+        views = self._entries.get(run_id)
+        if views is None:
+            views = self._entries[run_id] = {}
+        views[(version, view)] = CachedResponse(
+            body=body,
+            status=status,
+            expires_at=time.monotonic() + ttl_s,
+        )
+        self._entries.move_to_end(run_id)
+        if len(self._entries) > self._max_runs:
+            self._entries.popitem(last=False)
+
+
+run_response_cache = RunResponseCache()
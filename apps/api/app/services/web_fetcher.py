@@ -2,16 +2,32 @@ from __future__ import annotations
 
 import ipaddress
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass
-from typing import Final
+from functools import lru_cache
+from typing import Any, Final
 from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
 
 _MAX_BYTES: Final[int] = 1_000_000  # 1 MB
+_CHUNK_SIZE: Final[int] = 64 * 1024
+# Content types worth downloading; anything else (PDFs, images, ...) would
+# only be discarded by the text extraction.
+_TEXT_CONTENT_TYPES: Final[tuple[str, ...]] = ("text/html", "application/xhtml", "text/plain")
 _USER_AGENT: Final[str] = "InquiryOS/0.1 (Research Reader)"
+_READER_USER_AGENT: Final[str] = "InquiryOS/0.1 (+https://localhost)"
+# Ask for the types fetch_html accepts, so content-negotiating servers send
+# HTML instead of something we'd reject. httpx already requests gzip/deflate.
+_ACCEPT: Final[str] = "text/html,application/xhtml+xml;q=0.9,text/plain;q=0.8"
+_SENTENCE_SPLIT_RE: Final = re.compile(r"(?<=[.!?])\s+")
+
+
+# Names that resolve to loopback. Subdomains of .localhost do too (RFC 6761),
+# so those are matched by suffix.
+_LOCALHOST_NAMES: Final = frozenset({"localhost", "ip6-localhost", "ip6-loopback"})
 
 
 class UnsafeUrlError(Exception):
@@ -22,10 +38,22 @@ class UnsafeUrlError(Exception):
 class FetchedPage:
     url: str
     status_code: int
-    html: str
+    body: bytes
+
+    @property
+    def html(self) -> str:
+        # Decoded on demand: the parser takes `body` as-is, so the reader never
+        # needs this copy.
+        return self.body.decode("utf-8", errors="replace")
 
 
 def _is_private_or_local_ip(host: str) -> bool:
+    # ip_address() only accepts dotted-quad IPv4 (leading digit) or IPv6
+    # (contains ":"); skip it, and the ValueError it raises, for the usual
+    # case of a DNS name.
+    if not (host[:1].isdigit() or ":" in host):
+        return False
+
     try:
         ip = ipaddress.ip_address(host)
     except ValueError:
@@ -39,42 +67,63 @@ def _is_private_or_local_ip(host: str) -> bool:
     )
 
 
-def _validate_url(url: str) -> None:
+@lru_cache(maxsize=4096)
+def _validation_error(url: str) -> str | None:
+    # Pure function of the URL string, so the result is memoized: the same
+    # search-result URLs come up again across runs.
     parsed = urlparse(url)
 
     if parsed.scheme not in {"http", "https"}:
-        raise UnsafeUrlError("Only http/https URLs are allowed.")
+        return "Only http/https URLs are allowed."
 
     if not parsed.netloc:
-        raise UnsafeUrlError("URL must include a hostname.")
+        return "URL must include a hostname."
 
-    host = parsed.hostname or ""
-    if host in {"localhost"}:
-        raise UnsafeUrlError("Localhost URLs are not allowed.")
+    host = (parsed.hostname or "").rstrip(".")
+    if host in _LOCALHOST_NAMES or host.endswith(".localhost"):
+        return "Localhost URLs are not allowed."
 
     # If hostname is an IP, block private/local ranges
     if _is_private_or_local_ip(host):
-        raise UnsafeUrlError("Private/local IP URLs are not allowed.")
+        return "Private/local IP URLs are not allowed."
 
+    return None
 
-async def _fetch_html_with_client(url: str, client: httpx.AsyncClient) -> FetchedPage:
-    async with client.stream("GET", url) as resp:
+
+def _validate_url(url: str) -> None:
+    error = _validation_error(url)
+    if error is not None:
+        raise UnsafeUrlError(error)
+
+
+async def _fetch_html_with_client(
+    url: str,
+    client: httpx.AsyncClient,
+    **request_options: Any,
+) -> FetchedPage:
+    async with client.stream("GET", url, **request_options) as resp:
         resp.raise_for_status()
 
+        # Reject from the headers when they already tell us, before reading
+        # any of the body. Either header may be missing; then the streaming
+        # cap below still applies.
+        content_length = resp.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > _MAX_BYTES:
+            raise httpx.HTTPError("Response too large")
+
+        content_type = resp.headers.get("content-type", "").lower()
+        if content_type and not content_type.startswith(_TEXT_CONTENT_TYPES):
+            raise httpx.HTTPError(f"Unsupported content type: {content_type.split(';')[0]}")
+
         chunks: list[bytes] = []
         total = 0
-        async for chunk in resp.aiter_bytes():
-            if not chunk:
-                continue
+        async for chunk in resp.aiter_bytes(chunk_size=_CHUNK_SIZE):
             chunks.append(chunk)
             total += len(chunk)
             if total > _MAX_BYTES:
                 raise httpx.HTTPError("Response too large")
 
-        content = b"".join(chunks)
-
-    html = content.decode("utf-8", errors="replace")
-    return FetchedPage(url=url, status_code=200, html=html)
+    return FetchedPage(url=url, status_code=200, body=b"".join(chunks))
 
 
 async def fetch_html(
@@ -85,46 +134,51 @@ async def fetch_html(
 ) -> FetchedPage:
     _validate_url(url)
 
-    headers = {"User-Agent": _USER_AGENT}
-
-    # If a client is provided, reuse it. Otherwise create a one-off client.
+    # If a client is provided, reuse it as configured. Otherwise borrow the
+    # shared pooled client rather than building a one-off client (and TLS
+    # context) per call; timeout and User-Agent are then set per request.
     if client is None:
-        async with httpx.AsyncClient(
+        return await _fetch_html_with_client(
+            url,
+            get_reader_client(),
             timeout=timeout_s,
-            follow_redirects=True,
-            headers=headers,
-        ) as local_client:
-            return await _fetch_html_with_client(url, local_client)
-    else:
-        # Ensure headers exist even on a shared client (best-effort, don't mutate if already set)
-        if "User-Agent" not in client.headers:
-            client.headers.update(headers)
-        return await _fetch_html_with_client(url, client)
+            headers={"User-Agent": _USER_AGENT, "Accept": _ACCEPT},
+        )
+    return await _fetch_html_with_client(url, client)
 
 
-def extract_text_from_html(html: str) -> str:
-    soup = BeautifulSoup(html, "lxml")
+def extract_text_from_html(html: str | bytes) -> str:
+    tree = LexborHTMLParser(html)
 
     # Remove noisy tags
-    for tag in soup(["script", "style", "noscript", "header", "footer", "nav", "aside"]):
-        tag.decompose()
+    tree.strip_tags(["script", "style", "noscript", "header", "footer", "nav", "aside"])
 
-    text = soup.get_text(separator=" ", strip=True)
-    text = re.sub(r"\s+", " ", text).strip()
+    text = tree.root.text(separator=" ", strip=True) if tree.root else ""
+    # Collapse whitespace runs
+    return " ".join(text.split())
 
-    return text
+
+def _iter_sentences(text: str) -> Iterator[str]:
+    # Lazy equivalent of _SENTENCE_SPLIT_RE.split(text). basic_summary still
+    # collapses whitespace over the whole text first, but stops matching
+    # sentences once it has enough, and never builds a list of all of them.
+    start = 0
+    for match in _SENTENCE_SPLIT_RE.finditer(text):
+        yield text[start:match.start()]
+        start = match.end()
+    yield text[start:]
 
 
 def basic_summary(text: str, max_chars: int = 800) -> str:
     if not text:
         return ""
 
-    cleaned = re.sub(r"\s+", " ", text).strip()
+    cleaned = " ".join(text.split())
     if not cleaned:
         return ""
 
     # Split into rough sentences
-    sentences = re.split(r"(?<=[.!?])\s+", cleaned)
+    sentences = _iter_sentences(cleaned)
 
     selected: list[str] = []
     total_len = 0
@@ -169,4 +223,39 @@ def basic_summary(text: str, max_chars: int = 800) -> str:
         return " ".join(selected)
 
     # Fallback if sentence splitting found nothing useful
-    return cleaned[:max_chars].strip()
\ No newline at end of file
+    return cleaned[:max_chars].strip()
+
+
+@lru_cache(maxsize=1)
+def get_reader_client() -> httpx.AsyncClient:
+    """
+    Process-wide client for the web reader's page fetches (and fetch_html
+    calls that don't pass their own client).
+
+    Building an AsyncClient sets up a fresh TLS context, and a per-run client
+    also threw away its keep-alive connections; sharing one avoids both.
+    HTTP/2 is left off: reader fetches mostly go to distinct hosts, so there
+    is little to multiplex.
+    """
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(10.0, connect=3.0),
+        follow_redirects=True,
+        headers={"User-Agent": _READER_USER_AGENT, "Accept": _ACCEPT},
+        limits=httpx.Limits(
+            max_connections=50,
+            max_keepalive_connections=20,
+            keepalive_expiry=30.0,
+        ),
+    )
+
+
+async def close_reader_client() -> None:
+    """
+    Close the shared reader client, if one was ever created.
+    Called on app shutdown.
+    """
+    if get_reader_client.cache_info().currsize == 0:
+        return
+
+    await get_reader_client().aclose()
+    get_reader_client.cache_clear()
@@ -139,50 +139,36 @@ export interface ExecutionAccepted {
     message: string;
 }
 
+export interface ResearchRunSummary {
+    id: string;
+    title: string | null;
+    query: string;
+    status: ResearchRunStatus;
+    created_at: string;
+}
+
+export interface ResearchRunPage {
+    items: ResearchRunSummary[];
+    next_cursor: string | null;
+}
+
 export async function listResearchRuns(
     limit = 10,
-    offset = 0,
-): Promise<ResearchRunRead[]> {
+    cursor: string | null = null,
+): Promise<ResearchRunPage> {
     const baseUrl =
         import.meta.env.VITE_API_BASE_URL?.toString() ||
         "http://localhost:8000/api/v1";
 
-    const url = `${baseUrl}/research-runs?limit=${limit}&offset=${offset}`;
-
-    const res = await fetch(url, {
-        method: "GET",
-    });
-
-    if (!res.ok) {
-        let message = `Request failed with status ${res.status}`;
-
-        try {
-            const data = await res.json();
-            if (data && typeof data.detail === "string") {
-                message = data.detail;
-            }
-        } catch {
-            // ignore JSON parse error
-        }
-
-        throw new Error(message);
+    const qs = new URLSearchParams({ limit: String(limit) });
+    if (cursor) {
+        qs.set("cursor", cursor);
     }
 
-    return (await res.json()) as ResearchRunRead[];
-}
-
-
-export async function runDummySearch(
-    runId: string,
-): Promise<ResearchRunDetail> {
-    const baseUrl =
-        import.meta.env.VITE_API_BASE_URL?.toString() ||
-        "http://localhost:8000/api/v1";
-
-    const url = `${baseUrl}/research-runs/${runId}/search-dummy`;
+    const url = `${baseUrl}/research-runs?${qs.toString()}`;
 
     const res = await fetch(url, {
-        method: "POST",
+        method: "GET",
     });
 
     if (!res.ok) {
@@ -200,39 +186,17 @@ export async function runDummySearch(
         throw new Error(message);
     }
 
-    return (await res.json()) as ResearchRunDetail;
+    return (await res.json()) as ResearchRunPage;
 }
 
 
-export async function runDummySynthesis(
+export async function advancePipeline(
     runId: string,
 ): Promise<ResearchRunDetail> {
-    const baseUrl =
-        import.meta.env.VITE_API_BASE_URL?.toString() ||
-        "http://localhost:8000/api/v1";
-
-    const url = `${baseUrl}/research-runs/${runId}/synthesize-dummy`;
-
-    const res = await fetch(url, {
-        method: "POST",
-    });
-
-    if (!res.ok) {
-        let message = `Request failed with status ${res.status}`;
-
-        try {
-            const data = await res.json();
-            if (data && typeof data.detail === "string") {
-                message = data.detail;
-            }
-        } catch {
-            // ignore JSON parse error
-        }
-
-        throw new Error(message);
-    }
-
-    return (await res.json()) as ResearchRunDetail;
+    return apiPost<Record<string, never>, ResearchRunDetail>(
+        `/research-runs/${runId}/advance`,
+        {},
+    );
 }
 
 export async function getResearchRunState(runId: string): Promise<ResearchRunState> {
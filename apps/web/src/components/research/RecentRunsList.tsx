@@ -1,4 +1,4 @@
-import type { ResearchRunRead } from "../../api/research";
+import type { ResearchRunSummary } from "../../api/research";
 
 function formatDate(value: string): string {
     const date = new Date(value);
@@ -7,7 +7,7 @@ function formatDate(value: string): string {
 }
 
 type RecentRunsListProps = {
-    runs: ResearchRunRead[];
+    runs: ResearchRunSummary[];
     isLoading: boolean;
     error: string | null;
     selectedRunId: string | null;
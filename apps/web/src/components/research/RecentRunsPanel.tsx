@@ -1,6 +1,6 @@
 import { useEffect, useState } from "react";
 import type {
-    ResearchRunRead,
+    ResearchRunSummary,
     ResearchRunDetail,
     ResearchRunState,
 } from "../../api/research";
@@ -18,7 +18,7 @@ type RecentRunsPanelProps = {
 };
 
 export function RecentRunsPanel({ autoRunId }: RecentRunsPanelProps) {
-    const [runs, setRuns] = useState<ResearchRunRead[]>([]);
+    const [runs, setRuns] = useState<ResearchRunSummary[]>([]);
     const [isLoading, setIsLoading] = useState(false);
     const [error, setError] = useState<string | null>(null);
     const [selectedDetail, setSelectedDetail] = useState<ResearchRunDetail | null>(null);
@@ -38,9 +38,9 @@ export function RecentRunsPanel({ autoRunId }: RecentRunsPanelProps) {
             setError(null);
 
             try {
-                const data = await listResearchRuns(10, 0);
+                const data = await listResearchRuns(10);
                 if (!cancelled) {
-                    setRuns(data);
+                    setRuns(data.items);
                 }
             } catch (err) {
                 if (!cancelled) {
@@ -78,9 +78,9 @@ export function RecentRunsPanel({ autoRunId }: RecentRunsPanelProps) {
                 if (cancelled) return;
                 setSelectedDetail(detail);
 
-                const refreshedRuns = await listResearchRuns(10, 0);
+                const refreshedRuns = await listResearchRuns(10);
                 if (cancelled) return;
-                setRuns(refreshedRuns);
+                setRuns(refreshedRuns.items);
 
                 await executePipeline(runId, "real");
                 if (cancelled) return;
@@ -162,8 +162,8 @@ export function RecentRunsPanel({ autoRunId }: RecentRunsPanelProps) {
 
                 // 3. Stop when done
                 if (state.status === "completed" || state.status === "failed") {
-                    const refreshedRuns = await listResearchRuns(10, 0);
-                    setRuns(refreshedRuns);
+                    const refreshedRuns = await listResearchRuns(10);
+                    setRuns(refreshedRuns.items);
                     return;
                 }
             } catch {